@@ -0,0 +1,266 @@
+import argparse
+import json
+import sqlite3
+import sys
+import time
+
+import feedback
+from wordstore import MAX_LENGTH
+
+# game history database
+#
+# Optional SQLite store for every game played, by the UI or by headless
+# runs, so history can be queried without reading it all back:
+#   python analytics.py import results.jsonl --strategy entropy
+#   python analytics.py summary --strategy entropy
+#   python analytics.py hardest --limit 20
+#
+# games holds one row per game, guesses one row per guess with its feedback
+# pattern code. Per-letter feedback is the letter_feedback view, which
+# decodes the pattern instead of storing five more rows per guess. The
+# database runs in WAL mode so readers are not blocked by a writer, and
+# inserts go through executemany inside one transaction per batch.
+
+DB_FILE = "wordle_history.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    day TEXT NOT NULL,
+    secret TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    won INTEGER NOT NULL,
+    guess_count INTEGER NOT NULL,
+    duration REAL
+);
+CREATE TABLE IF NOT EXISTS guesses (
+    game_id INTEGER NOT NULL,
+    turn INTEGER NOT NULL,
+    word TEXT NOT NULL,
+    pattern INTEGER NOT NULL,
+    PRIMARY KEY (game_id, turn)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS positions (position INTEGER PRIMARY KEY, weight INTEGER NOT NULL);
+DROP VIEW IF EXISTS letter_feedback;
+CREATE VIEW letter_feedback AS
+    SELECT g.game_id, g.turn, p.position,
+           substr(g.word, p.position + 1, 1) AS letter,
+           g.pattern / p.weight % 3 AS state
+    FROM guesses g CROSS JOIN positions p
+    WHERE p.position < length(g.word);
+CREATE INDEX IF NOT EXISTS games_secret ON games (secret, won, guess_count);
+CREATE INDEX IF NOT EXISTS games_day ON games (day);
+CREATE INDEX IF NOT EXISTS games_strategy ON games (strategy, day, won, guess_count);
+CREATE INDEX IF NOT EXISTS guesses_word ON guesses (word);
+"""
+
+INSERT_GAME = "INSERT INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+INSERT_GUESS = "INSERT INTO guesses VALUES (?, ?, ?, ?)"
+
+
+class HistoryDB:
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO positions VALUES (?, ?)",
+            [(p, 3 ** p) for p in range(MAX_LENGTH)]
+        )
+
+    def close(self):
+        self.conn.close()
+
+    # writing
+    def record_games(self, games, strategy="player"):
+        # games are dicts as written by stats.py or simulate.py:
+        # secret, guesses, won (or solved), optional strategy/time/duration
+        now = time.time()
+        game_rows = []
+        guess_rows = []
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            next_id = conn.execute("SELECT coalesce(max(id), 0) + 1 FROM games").fetchone()[0]
+            for game in games:
+                secret = game["secret"].upper()
+                guesses = [g.upper() for g in game["guesses"]]
+                played_at = game.get("time", now)
+                won = game.get("won", game.get("solved", False))
+                game_rows.append((
+                    next_id, played_at, time.strftime("%Y-%m-%d", time.localtime(played_at)),
+                    secret, game.get("strategy", strategy), int(bool(won)), len(guesses),
+                    game.get("duration")
+                ))
+                codes = feedback.score_secret(guesses, secret)
+                guess_rows.extend(
+                    (next_id, turn, word, code)
+                    for turn, (word, code) in enumerate(zip(guesses, codes), 1)
+                )
+                next_id += 1
+            conn.executemany(INSERT_GAME, game_rows)
+            conn.executemany(INSERT_GUESS, guess_rows)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return len(game_rows)
+
+    def import_jsonl(self, path, strategy="player", batch_size=10000):
+        total = 0
+        batch = []
+        with open(path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                batch.append(json.loads(line))
+                if len(batch) >= batch_size:
+                    total += self.record_games(batch, strategy)
+                    batch = []
+        if batch:
+            total += self.record_games(batch, strategy)
+        return total
+
+    # queries
+    def _where(self, strategy=None, since=None, until=None, secret=None):
+        clauses, params = [], []
+        if strategy is not None:
+            clauses.append("strategy = ?")
+            params.append(strategy)
+        if since is not None:
+            clauses.append("day >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("day <= ?")
+            params.append(until)
+        if secret is not None:
+            clauses.append("secret = ?")
+            params.append(secret.upper())
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def summary(self, **filters):
+        where, params = self._where(**filters)
+        games, wins, guesses = self.conn.execute(
+            "SELECT count(*), coalesce(sum(won), 0), "
+            "coalesce(sum(CASE WHEN won THEN guess_count END), 0) FROM games" + where,
+            params
+        ).fetchone()
+        return {
+            "games": games,
+            "wins": wins,
+            "losses": games - wins,
+            "win_rate": wins / games * 100 if games else 0.0,
+            "mean_guesses": guesses / wins if wins else 0.0,
+        }
+
+    def distribution(self, **filters):
+        # guess count -> wins, losses under "X"
+        where, params = self._where(**filters)
+        rows = self.conn.execute(
+            "SELECT CASE WHEN won THEN guess_count ELSE 'X' END AS bucket, count(*) "
+            "FROM games" + where + " GROUP BY bucket",
+            params
+        ).fetchall()
+        return {str(bucket): count for bucket, count in rows}
+
+    def hardest_secrets(self, limit=10, min_games=1, **filters):
+        # lowest win rate first, then most guesses needed
+        where, params = self._where(**filters)
+        return self.conn.execute(
+            "SELECT secret, count(*) AS n, avg(won) * 100 AS win_rate, avg(guess_count) AS mean "
+            "FROM games" + where + " GROUP BY secret HAVING n >= ? "
+            "ORDER BY win_rate ASC, mean DESC, secret LIMIT ?",
+            params + [min_games, limit]
+        ).fetchall()
+
+    def streaks(self, **filters):
+        # runs of wins in play order, split by every loss
+        where, params = self._where(**filters)
+        longest = self.conn.execute(
+            "SELECT coalesce(max(n), 0) FROM (SELECT count(*) AS n FROM ("
+            "SELECT won, sum(1 - won) OVER (ORDER BY id) AS run FROM games" + where +
+            ") WHERE won GROUP BY run)",
+            params
+        ).fetchone()[0]
+        last_loss = self.conn.execute(
+            "SELECT coalesce(max(id), 0) FROM games" + _and(where, "won = 0"), params
+        ).fetchone()[0]
+        current = self.conn.execute(
+            "SELECT count(*) FROM games" + _and(where, "id > ?"), params + [last_loss]
+        ).fetchone()[0]
+        return {"current": current, "longest": longest}
+
+    def word_usage(self, word, **filters):
+        # how often a word was guessed and how often it was the answer
+        where, params = self._where(**filters)
+        guessed = self.conn.execute(
+            "SELECT count(*) FROM guesses JOIN games ON games.id = guesses.game_id" +
+            _and(where, "word = ?"),
+            params + [word.upper()]
+        ).fetchone()[0]
+        stats = self.summary(secret=word, **filters)
+        return {"guessed": guessed, "as_secret": stats["games"], "win_rate": stats["win_rate"]}
+
+
+def _and(where, clause):
+    return where + (" AND " if where else " WHERE ") + clause
+
+
+def main(argv=None):
+    # shared by every subcommand, so they go after it as documented above
+    filters = argparse.ArgumentParser(add_help=False)
+    filters.add_argument("--db", default=DB_FILE)
+    filters.add_argument("--strategy", default=None, help="only games played by this strategy")
+    filters.add_argument("--since", default=None, help="first day, YYYY-MM-DD")
+    filters.add_argument("--until", default=None, help="last day, YYYY-MM-DD")
+    parser = argparse.ArgumentParser(description="Query the game history database.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", parents=[filters], help="load a simulate.py JSONL file")
+    imp.add_argument("paths", nargs="+")
+    sub.add_parser("summary", parents=[filters])
+    sub.add_parser("distribution", parents=[filters])
+    sub.add_parser("streaks", parents=[filters])
+    hardest = sub.add_parser("hardest", parents=[filters])
+    hardest.add_argument("--limit", type=int, default=10)
+    hardest.add_argument("--min-games", type=int, default=1)
+    word = sub.add_parser("word", parents=[filters])
+    word.add_argument("word")
+    args = parser.parse_args(argv)
+
+    db = HistoryDB(args.db)
+    filters = {"strategy": args.strategy, "since": args.since, "until": args.until}
+    try:
+        if args.command == "import":
+            for path in args.paths:
+                count = db.import_jsonl(path, strategy=args.strategy or "player")
+                print(f"{path}: {count} games")
+        elif args.command == "summary":
+            s = db.summary(**filters)
+            print(f"games: {s['games']}  wins: {s['wins']}  losses: {s['losses']}")
+            print(f"win rate: {s['win_rate']:.1f}%  mean guesses (wins): {s['mean_guesses']:.3f}")
+        elif args.command == "distribution":
+            dist = db.distribution(**filters)
+            total = sum(dist.values()) or 1
+            for bucket in sorted(dist, key=lambda b: (b == "X", b)):
+                print(f"{bucket:>2} {dist[bucket]:>8} {'#' * round(dist[bucket] / total * 50)}")
+        elif args.command == "streaks":
+            s = db.streaks(**filters)
+            print(f"current streak: {s['current']}  longest: {s['longest']}")
+        elif args.command == "hardest":
+            rows = db.hardest_secrets(args.limit, args.min_games, **filters)
+            for secret, n, rate, mean in rows:
+                print(f"{secret}  games: {n:>6}  win rate: {rate:5.1f}%  mean guesses: {mean:.2f}")
+        elif args.command == "word":
+            u = db.word_usage(args.word, **filters)
+            print(f"guessed: {u['guessed']}  as secret: {u['as_secret']}  win rate: {u['win_rate']:.1f}%")
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import heapq
+import os
+import time
+import tkinter as tk
+
+# animation scheduler
+#
+# One fixed-rate clock drives every in-flight animation step (tile flips,
+# keyboard recolours, bubble timeouts) instead of each one chaining its own
+# root.after calls. Steps are queued with a delay and an optional group so a
+# whole reveal can be cancelled at once. The clock only ticks while
+# something is queued.
+#
+# speed scales every delay: 1.0 is normal, 0.5 twice as fast, and 0 runs
+# steps immediately (no animation), which automated runs rely on. It can be
+# set with the WORDLE_ANIMATION_SPEED environment variable.
+
+DEFAULT_FPS = 60
+
+
+def default_speed():
+    try:
+        return max(0.0, float(os.environ.get("WORDLE_ANIMATION_SPEED", "1")))
+    except ValueError:
+        return 1.0
+
+
+class Animator:
+    def __init__(self, root, fps=DEFAULT_FPS, speed=None):
+        self.root = root
+        self.tick_ms = max(1, int(1000 / fps))
+        self.speed = default_speed() if speed is None else speed
+        self._queue = []
+        self._seq = 0
+        self._tick_id = None
+
+    def now(self):
+        return time.perf_counter() * 1000
+
+    def schedule(self, delay_ms, callback, group=None):
+        delay = delay_ms * self.speed
+        if delay <= 0 and not self._queue:
+            callback()
+            return
+        self._seq += 1
+        heapq.heappush(self._queue, (self.now() + delay, self._seq, callback, group))
+        if self._tick_id is None:
+            self._tick_id = self.root.after(self.tick_ms, self._tick)
+
+    def cancel(self, group):
+        queue = [item for item in self._queue if item[3] != group]
+        if len(queue) != len(self._queue):
+            heapq.heapify(queue)
+            self._queue = queue
+
+    def pending(self, group=None):
+        if group is None:
+            return bool(self._queue)
+        return any(item[3] == group for item in self._queue)
+
+    def flush(self):
+        # run everything that is queued right now, in order
+        while self._queue:
+            _, _, callback, _ = heapq.heappop(self._queue)
+            callback()
+
+    def _tick(self):
+        self._tick_id = None
+        now = self.now()
+        while self._queue and self._queue[0][0] <= now:
+            _, _, callback, _ = heapq.heappop(self._queue)
+            callback()
+        if self._queue:
+            self._tick_id = self.root.after(self.tick_ms, self._tick)
+
+
+class BubblePool:
+    # reusable message bubbles, placed over the root window
+    def __init__(self, root, animator, lifetime_ms=2000):
+        self.root = root
+        self.animator = animator
+        self.lifetime_ms = lifetime_ms
+        self.free = []
+        self.active = []
+
+    def show(self, x, y, message, color):
+        if self.animator.speed == 0:
+            return
+        if self.free:
+            frame, label = self.free.pop()
+        else:
+            frame = tk.Frame(self.root, relief="solid", borderwidth=2)
+            label = tk.Label(
+                frame,
+                font=("Clarendon BT", 10, "bold"),
+                fg="white",
+                padx=2,
+                pady=1
+            )
+            label.pack()
+        frame.config(bg=color)
+        label.config(text=message, bg=color)
+        frame.place(x=x, y=y)
+        frame.lift()
+        bubble = (frame, label)
+        self.active.append(bubble)
+        self.animator.schedule(self.lifetime_ms, lambda: self.release(bubble), group="bubble")
+
+    def release(self, bubble):
+        if bubble in self.active:
+            self.active.remove(bubble)
+            bubble[0].place_forget()
+            self.free.append(bubble)
+
+    def clear(self):
+        self.animator.cancel("bubble")
+        for bubble in list(self.active):
+            self.release(bubble)
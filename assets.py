@@ -0,0 +1,256 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import tkinter as tk
+from collections import OrderedDict
+
+from profiler import traced
+
+# image cache
+#
+# Decoded (and resized) PhotoImages keyed by (path, size), so popups and
+# screen switches don't re-read and re-resample the same PNG every time.
+# Memory is bounded: least recently used images are dropped once the
+# estimated pixel memory goes over max_bytes. Callers keep their own
+# reference to the image while it is on screen, so eviction never blanks
+# a visible canvas.
+#
+# prefetch() does the slow part (PNG decode and resize, or reading the
+# baked PPM) on a worker thread ahead of time; the next get() for that
+# path and size then only has to wrap the result in a PhotoImage, which
+# Tk requires on its own thread.
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# baked variants
+#
+# `python assets.py bake` pre-renders the resized backgrounds into one
+# pack of binary PPMs plus a JSON index. Tk decodes PPM natively, so at
+# runtime a baked variant is loaded with no PIL and no resampling. A
+# variant is used when it covers the requested size without being more
+# than BAKE_SLACK larger (the canvas just crops the excess); otherwise the
+# image is resized as before.
+BAKE_DIR = os.path.join("images", "baked")
+BAKE_PACK = "pack.bin"
+BAKE_INDEX = "index.json"
+BAKE_SLACK = 1.25
+
+SCREEN_SIZES = [(1280, 720), (1366, 768), (1536, 864), (1920, 1080), (2560, 1440)]
+POPUP_SIZES = [(300, 200), (400, 300), (800, 600)]
+BAKE_PLAN = {
+    "images/bg_fix.png": SCREEN_SIZES,
+    "images/bg_game.png": SCREEN_SIZES,
+    "images/bg_ins.png": POPUP_SIZES,
+}
+
+
+def _source_stamp(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def bake(plan=BAKE_PLAN, out_dir=BAKE_DIR):
+    from PIL import Image
+
+    os.makedirs(out_dir, exist_ok=True)
+    index = {"version": 1, "variants": {}}
+    offset = 0
+    tmp = os.path.join(out_dir, BAKE_PACK + ".tmp")
+    with open(tmp, "wb") as pack:
+        for path, sizes in plan.items():
+            src = Image.open(path).convert("RGB")
+            entries = index["variants"][path] = []
+            for w, h in sizes:
+                img = src.resize((w, h), Image.LANCZOS)
+                data = b"P6\n%d %d\n255\n" % (w, h) + img.tobytes()
+                pack.write(data)
+                entries.append({
+                    "size": [w, h],
+                    "offset": offset,
+                    "length": len(data),
+                    "source": _source_stamp(path),
+                })
+                offset += len(data)
+    os.replace(tmp, os.path.join(out_dir, BAKE_PACK))
+    with open(os.path.join(out_dir, BAKE_INDEX), "w") as f:
+        json.dump(index, f, indent=1)
+    return index
+
+
+class BakedPack:
+    def __init__(self, out_dir=BAKE_DIR):
+        self.pack_path = os.path.join(out_dir, BAKE_PACK)
+        try:
+            with open(os.path.join(out_dir, BAKE_INDEX), "r") as f:
+                self.variants = json.load(f).get("variants", {})
+        except (OSError, ValueError):
+            self.variants = {}
+        self._stamps = {}
+
+    def find(self, path, size):
+        entries = self.variants.get(path)
+        if not entries:
+            return None
+        if path not in self._stamps:
+            try:
+                self._stamps[path] = _source_stamp(path)
+            except OSError:
+                self._stamps[path] = None
+        w, h = size
+        best = None
+        for entry in entries:
+            ew, eh = entry["size"]
+            if entry["source"] != self._stamps[path]:
+                continue
+            if ew < w or eh < h or ew > w * BAKE_SLACK or eh > h * BAKE_SLACK:
+                continue
+            if best is None or ew * eh < best["size"][0] * best["size"][1]:
+                best = entry
+        return best
+
+    def read(self, entry):
+        with open(self.pack_path, "rb") as f:
+            f.seek(entry["offset"])
+            return f.read(entry["length"])
+
+
+class ImageCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._baked = None
+        self._prepared = {}
+        self._preparing = set()
+        self._failed = {}
+
+    def get(self, path, size=None, master=None):
+        key = (path, tuple(size) if size else None)
+        item = self._items.get(key)
+        if item is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+        self.misses += 1
+        image = self._load(path, key[1], master)
+        cost = image.width() * image.height() * 4
+        self._items[key] = (image, cost)
+        # a prefetch that finished after this load is no longer needed
+        self._prepared.pop(key, None)
+        self._failed.pop(key, None)
+        self.used += cost
+        self._evict()
+        return image
+
+    def prefetch(self, path, size=None):
+        key = (path, tuple(size) if size else None)
+        if key in self._items or key in self._prepared or key in self._preparing:
+            return
+        self._preparing.add(key)
+        self._failed.pop(key, None)
+
+        def work():
+            try:
+                prepared = self._prepare(path, key[1])
+                if key not in self._items:
+                    self._prepared[key] = prepared
+            except Exception as e:
+                # get() will try again on the Tk thread and raise it there
+                self._failed[key] = e
+            finally:
+                self._preparing.discard(key)
+        threading.Thread(target=work, daemon=True).start()
+
+    def ready(self, path, size=None):
+        # True once get() for this image no longer has to decode anything
+        key = (path, tuple(size) if size else None)
+        return key in self._items or key in self._prepared
+
+    def failed(self, path, size=None):
+        # the exception a prefetch ended with, None if it did not fail
+        return self._failed.get((path, tuple(size) if size else None))
+
+    def _prepare(self, path, size):
+        # everything that can run off the Tk thread
+        if size is None:
+            return ("file", path)
+        if self._baked is None:
+            self._baked = BakedPack()
+        entry = self._baked.find(path, size)
+        if entry is not None:
+            try:
+                return ("ppm", self._baked.read(entry))
+            except OSError:
+                pass
+        return self._prepare_pil(path, size)
+
+    @traced("image.load")
+    def _load(self, path, size, master):
+        prepared = self._prepared.pop((path, size), None) or self._prepare(path, size)
+        kind, data = prepared
+        if kind == "ppm":
+            try:
+                return tk.PhotoImage(data=data, format="ppm", master=master)
+            except tk.TclError:
+                kind, data = self._prepare_pil(path, size)
+        if kind == "file":
+            return tk.PhotoImage(file=data, master=master)
+        from PIL import ImageTk
+        return ImageTk.PhotoImage(data, master=master)
+
+    def _prepare_pil(self, path, size):
+        from PIL import Image
+        return ("pil", Image.open(path).resize(size, Image.LANCZOS))
+
+    def _evict(self):
+        # always keep the newest entry, even if it alone is over budget
+        while self.used > self.max_bytes and len(self._items) > 1:
+            _, (_, cost) = self._items.popitem(last=False)
+            self.used -= cost
+
+    def clear(self):
+        self._items.clear()
+        self._prepared.clear()
+        self._failed.clear()
+        self.used = 0
+
+    def __len__(self):
+        return len(self._items)
+
+
+_cache = ImageCache()
+
+
+def get_image(path, size=None, master=None):
+    return _cache.get(path, size, master)
+
+
+def prefetch_image(path, size=None):
+    _cache.prefetch(path, size)
+
+
+def get_cache():
+    return _cache
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wordle image assets.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("bake", help="pre-render resized backgrounds into %s" % BAKE_DIR)
+    args = parser.parse_args(argv)
+
+    if args.command == "bake":
+        index = bake()
+        for path, entries in index["variants"].items():
+            sizes = ", ".join("%dx%d" % tuple(e["size"]) for e in entries)
+            print(f"{path}: {sizes}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
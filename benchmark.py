@@ -0,0 +1,339 @@
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+import feedback
+import wordstore
+from wordle_engine import AbsurdleWordle, Wordle, submit_error
+
+# benchmark suite
+#
+#   python benchmark.py                         run and print a table
+#   python benchmark.py --json out.json         also write machine-readable results
+#   python benchmark.py --save-baseline         store results as the baseline
+#   python benchmark.py --compare               fail when slower than the baseline
+#
+# Cases needing Tk, PIL or pygame are skipped when those are missing or no
+# display/audio device is available (or always with --no-ui).
+
+BASELINE_FILE = "benchmark_baseline.json"
+DEFAULT_THRESHOLD = 0.25
+
+
+class Skip(Exception):
+    pass
+
+
+CASES = {}
+
+
+def case(name):
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+# engine
+@case("guess_single")
+def _guess_single(ctx):
+    store = wordstore.get_store()
+    feedback.get_table().matrix
+    rng = random.Random(1)
+    pairs = [(Wordle(rng.choice(store.words), store), rng.choice(store.words)) for _ in range(1000)]
+
+    def run():
+        for wordle, word in pairs:
+            wordle.guess(word)
+    return run, len(pairs)
+
+
+@case("guess_batch_row")
+def _guess_batch_row(ctx):
+    store = wordstore.get_store()
+    feedback.get_table().matrix
+    guesses = random.Random(2).sample(store.words, 100)
+
+    def run():
+        for word in guesses:
+            Wordle.score_secrets(word)
+    return run, len(guesses)
+
+
+@case("guess_batch_column")
+def _guess_batch_column(ctx):
+    store = wordstore.get_store()
+    feedback.get_table().matrix
+    wordle = Wordle(random.Random(3).choice(store.words), store)
+    words = list(store.words)
+
+    def run():
+        wordle.score_guesses(words)
+    return run, 1
+
+
+@case("absurdle_partition")
+def _absurdle_partition(ctx):
+    # adversary's pick over the full candidate set, must fit in a frame
+    store = wordstore.get_store()
+    feedback.get_table().matrix
+    wordle = AbsurdleWordle(store)
+    guesses = random.Random(5).sample(store.words, 100)
+
+    def run():
+        for word in guesses:
+            wordle.pattern(word)
+    return run, len(guesses)
+
+
+# word list
+@case("wordlist_load")
+def _wordlist_load(ctx):
+    def run():
+        wordstore.WordStore(wordstore.load_words())
+    return run, 1
+
+
+@case("wordlist_pack_open")
+def _wordlist_pack_open(ctx):
+    if wordstore.open_pack() is None:
+        wordstore.build_pack()
+
+    def run():
+        store = wordstore.open_pack()
+        store.ids
+        store.position_mask(0, "S")
+    return run, 1
+
+
+@case("submit_validation")
+def _submit_validation(ctx):
+    # the checks WordleApp.submit runs on Enter, in a hard mode game:
+    # playable, not in the list, and breaking a revealed hint
+    store = wordstore.get_store()
+    wordle = Wordle("CRANE", store, hard_mode=True)
+    wordle.attempt("TRACE")
+    rng = random.Random(4)
+    legal = wordle.legal_words()
+    words = ([rng.choice(legal) for _ in range(300)] + ["QQQQQ"] * 300
+             + [rng.choice(store.words) for _ in range(400)])
+
+    def run():
+        for word in words:
+            submit_error(wordle, word)
+    return run, len(words)
+
+
+@case("hard_mode_typing")
+def _hard_mode_typing(ctx):
+    # the per-keystroke check behind the hard mode label, every prefix
+    store = wordstore.get_store()
+    wordle = Wordle("CRANE", store, hard_mode=True)
+    wordle.attempt("TRACE")
+    words = random.Random(6).sample(store.words, 200)
+    prefixes = [w[:k] for w in words for k in range(1, len(w) + 1)]
+
+    def run():
+        for prefix in prefixes:
+            wordle.violation(prefix)
+    return run, len(prefixes)
+
+
+# UI assets
+def _tk_root(ctx):
+    if ctx.get("no_ui"):
+        raise Skip("--no-ui")
+    if "root" not in ctx:
+        try:
+            import tkinter as tk
+            root = tk.Tk()
+            root.withdraw()
+        except Exception as e:
+            raise Skip(f"no display: {e}")
+        ctx["root"] = root
+    return ctx["root"]
+
+
+def _resize_case(path, size):
+    def setup(ctx):
+        root = _tk_root(ctx)
+        try:
+            from PIL import Image, ImageTk
+        except ImportError:
+            raise Skip("PIL not installed")
+
+        def run():
+            bg = Image.open(path)
+            bg = bg.resize(size, Image.LANCZOS)
+            ImageTk.PhotoImage(bg, master=root)
+        return run, 1
+    return setup
+
+
+case("image_bg_fullscreen")(_resize_case("images/bg_game.png", (1920, 1080)))
+case("image_popup_300x200")(_resize_case("images/bg_ins.png", (300, 200)))
+case("image_popup_800x600")(_resize_case("images/bg_ins.png", (800, 600)))
+
+
+@case("image_popup_cached")
+def _image_popup_cached(ctx):
+    root = _tk_root(ctx)
+    if importlib.util.find_spec("PIL") is None:
+        raise Skip("PIL not installed")
+    from assets import ImageCache
+    cache = ImageCache()
+
+    def run():
+        cache.get("images/bg_ins.png", (300, 200), master=root)
+    return run, 1
+
+
+@case("sound_manager_init")
+def _sound_manager_init(ctx):
+    if ctx.get("no_ui"):
+        raise Skip("--no-ui")
+    try:
+        from sound import SoundManager
+        SoundManager()
+    except ImportError:
+        raise Skip("pygame not installed")
+    except Exception as e:
+        raise Skip(f"no audio device: {e}")
+
+    def run():
+        SoundManager()
+    return run, 1
+
+
+# runner
+def measure(run, repeat, min_time):
+    # repeat batches of calls, each batch lasting at least min_time
+    run()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        samples.append((time.perf_counter() - start) / loops)
+    return samples
+
+
+def run_suite(selected=None, repeat=5, min_time=0.05, no_ui=False):
+    ctx = {"no_ui": no_ui}
+    results = {}
+    for name, setup in CASES.items():
+        if selected and name not in selected:
+            continue
+        try:
+            run, ops = setup(ctx)
+        except Skip as e:
+            results[name] = {"skipped": str(e)}
+            continue
+        samples = measure(run, repeat, min_time)
+        best = min(samples)
+        results[name] = {
+            "best_us": best * 1e6,
+            "mean_us": sum(samples) / len(samples) * 1e6,
+            "per_op_us": best / ops * 1e6,
+            "ops": ops,
+            "repeat": len(samples),
+        }
+    if "root" in ctx:
+        ctx["root"].destroy()
+    return results
+
+
+def compare(results, baseline, threshold, overrides):
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if not old or "best_us" not in old or "best_us" not in result:
+            continue
+        limit = overrides.get(name, threshold)
+        ratio = result["best_us"] / old["best_us"]
+        result["baseline_us"] = old["best_us"]
+        result["ratio"] = ratio
+        if ratio > 1 + limit:
+            regressions.append((name, ratio, limit))
+    return regressions
+
+
+def print_table(results):
+    print(f"{'case':<24}{'best':>14}{'per op':>14}{'vs base':>10}")
+    for name, r in results.items():
+        if "skipped" in r:
+            print(f"{name:<24}{'skipped: ' + r['skipped']:>38}")
+            continue
+        ratio = f"{r['ratio']:.2f}x" if "ratio" in r else "-"
+        print(f"{name:<24}{r['best_us']:>12.1f}us{r['per_op_us']:>12.2f}us{ratio:>10}")
+
+
+def parse_overrides(items):
+    overrides = {}
+    for item in items or []:
+        name, _, value = item.partition("=")
+        overrides[name] = float(value)
+    return overrides
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wordle benchmark suite.")
+    parser.add_argument("cases", nargs="*", help="cases to run: %s" % ", ".join(CASES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--no-ui", action="store_true", help="skip Tk, PIL and pygame cases")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true", help="exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction, default 0.25")
+    parser.add_argument("--threshold-for", action="append", metavar="CASE=FRACTION",
+                        help="per-case threshold override")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.cases, args.repeat, args.min_time, args.no_ui)
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f).get("results", {})
+        regressions = compare(results, baseline, args.threshold, parse_overrides(args.threshold_for))
+
+    print_table(results)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"baseline saved to {args.baseline}")
+
+    for name, ratio, limit in regressions:
+        print(f"REGRESSION {name}: {ratio:.2f}x baseline (limit {1 + limit:.2f}x)")
+    if args.compare and regressions:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
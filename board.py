@@ -0,0 +1,434 @@
+import tkinter as tk
+
+from profiler import traced
+
+# board renderers
+#
+# WordleApp draws the tile grid and the on-screen keyboard through one of
+# these. Both take the same calls:
+#   set_letter(row, col, ch)      typed / revealed letter
+#   set_tile_state(row, col, st)  GRAY / YELLOW / GREEN colour of a tile
+#   set_key_state(letter, st)     keyboard colour
+#   reset(), show(), hide(), tile_position(row, col)
+#
+# WidgetBoard is the original Label/Button layout. CanvasBoard keeps the
+# letters and states in a small model and draws everything as items on the
+# game's background canvas; changes are collected and flushed in a single
+# redraw per event, and the layout follows the canvas size.
+
+KEYBOARD_ROWS = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
+BACKSPACE = "←"
+ENTER = "ENTER"
+
+
+class WidgetBoard:
+    def __init__(self, app):
+        self.app = app
+        self.root = app.root
+        self.colors = app.COLORS
+        self.tiles = []
+        self.key_buttons = {}
+        self.create_grid()
+        self.create_keyboard()
+
+    # grid
+    def create_grid(self):
+        app = self.app
+        self.grid_frame = tk.Frame(self.root, bg=self.colors["bg"])
+        for r in range(app.wordle.MAX_ATTEMPTS):
+            row = []
+            for c in range(app.wordle.WORD_LENGTH):
+                lbl = tk.Label(
+                    self.grid_frame,
+                    text="",
+                    font=("Clarendon BT", 28, "bold"),
+                    width=2,
+                    height=1,
+                    bg=self.colors["bg"],
+                    fg=self.colors["tile_text"],
+                    relief="groove",
+                    borderwidth=6
+                )
+                lbl.grid(row=r, column=c, padx=5, pady=5)
+                row.append(lbl)
+            self.tiles.append(row)
+
+    # keyboard
+    def create_keyboard(self):
+        app = self.app
+        self.keyboard_frame = tk.Frame(self.root, bg=self.colors["bg"])
+
+        for r, keys in enumerate(KEYBOARD_ROWS):
+            row_frame = tk.Frame(self.keyboard_frame, bg=self.colors["bg"])
+            row_frame.pack(pady=3)
+            for k in keys:
+                btn = tk.Button(
+                    row_frame,
+                    text=k,
+                    width=4,
+                    height=2,
+                    font=("Clarendon BT", 12, "bold"),
+                    bg=self.colors["key_default"],
+                    fg="white",
+                    activebackground="#565758",
+                    command=lambda ch=k: app.queue_input("key", ch)
+                )
+                btn.pack(side=tk.LEFT, padx=4)
+                self.key_buttons[k] = btn  # save reference
+            if r == 2:
+                tk.Button(
+                    row_frame, text=BACKSPACE, width=6, height=2,
+                    font=("Clarendon BT", 12, "bold"),
+                    bg=self.colors["key_default"], fg="white",
+                    command=lambda: app.queue_input("backspace")
+                ).pack(side=tk.LEFT, padx=3)
+                tk.Button(
+                    row_frame, text=ENTER, width=8, height=2,
+                    font=("Clarendon BT", 12, "bold"),
+                    bg="#538d4e", fg="white",
+                    command=lambda: app.queue_input("submit")
+                ).pack(side=tk.LEFT, padx=3)
+
+    def show(self):
+        self.grid_frame.pack(pady=35)
+        self.keyboard_frame.pack(pady=10)
+        self.grid_frame.lift()
+        self.keyboard_frame.lift()
+
+    def hide(self):
+        self.grid_frame.pack_forget()
+        self.keyboard_frame.pack_forget()
+
+    def set_letter(self, row, col, ch):
+        self.tiles[row][col].config(text=ch)
+
+    def set_tile_state(self, row, col, state):
+        color = self.colors[self.app.STATE_COLORS[state]]
+        self.tiles[row][col].config(bg=color, fg="white")
+
+    def set_key_state(self, letter, state):
+        btn = self.key_buttons.get(letter)
+        if btn:
+            btn.config(bg=self.colors[self.app.STATE_COLORS[state]])
+
+    def reset(self):
+        for row in self.tiles:
+            for tile in row:
+                tile.config(text="", bg=self.colors["bg"], fg=self.colors["tile_text"])
+        for btn in self.key_buttons.values():
+            btn.config(bg=self.colors["key_default"])
+
+    def tile_position(self, row, col):
+        # (x, y, width) of a tile relative to the root window
+        tile = self.tiles[row][col]
+        x = tile.winfo_rootx() - self.root.winfo_rootx()
+        y = tile.winfo_rooty() - self.root.winfo_rooty()
+        return x, y, tile.winfo_width()
+
+
+class BoardModel:
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.reset()
+
+    def reset(self):
+        self.letters = [[""] * self.cols for _ in range(self.rows)]
+        self.states = [[None] * self.cols for _ in range(self.rows)]
+        self.key_states = {}
+
+
+class CanvasBoard:
+    def __init__(self, app, canvas=None):
+        self.app = app
+        self.root = app.root
+        self.colors = app.COLORS
+        self.canvas = canvas or app.bg_canvas
+        self.model = BoardModel(app.wordle.MAX_ATTEMPTS, app.wordle.WORD_LENGTH)
+
+        self.tile_items = {}
+        self.key_items = {}
+        self.key_boxes = {}
+        self.tile_box = {}
+        self.visible = False
+        self._dirty_tiles = set()
+        self._dirty_keys = set()
+        self._relayout = True
+        self._flush_id = None
+        self._size = None
+
+        self._create_items()
+        self.canvas.bind("<Configure>", self._on_configure, add="+")
+
+    def _create_items(self):
+        self._create_tiles()
+        self._create_keys()
+
+    def _create_tile(self):
+        c = self.canvas
+        rect = c.create_rectangle(0, 0, 0, 0, width=4, tags=("board",))
+        text = c.create_text(0, 0, text="", fill=self.colors["tile_text"], tags=("board",))
+        return rect, text
+
+    def _create_tiles(self):
+        for r in range(self.model.rows):
+            for col in range(self.model.cols):
+                self.tile_items[(r, col)] = self._create_tile()
+
+    def _create_keys(self):
+        c = self.canvas
+        keys = [k for row in KEYBOARD_ROWS for k in row] + [BACKSPACE, ENTER]
+        queue_input = self.app.queue_input
+        actions = {BACKSPACE: lambda: queue_input("backspace"), ENTER: lambda: queue_input("submit")}
+        for k in keys:
+            tag = f"key-{len(self.key_items)}"
+            fill = "#538d4e" if k == ENTER else self.colors["key_default"]
+            rect = c.create_rectangle(0, 0, 0, 0, fill=fill, outline="", tags=("board", tag))
+            text = c.create_text(0, 0, text=k, fill="white", tags=("board", tag))
+            self.key_items[k] = (rect, text)
+            action = actions.get(k) or (lambda ch=k: queue_input("key", ch))
+            c.tag_bind(tag, "<Button-1>", lambda e, a=action: a())
+
+    # model updates, drawn on the next flush
+    def set_letter(self, row, col, ch):
+        self.model.letters[row][col] = ch
+        self._dirty_tiles.add((row, col))
+        self._schedule()
+
+    def set_tile_state(self, row, col, state):
+        self.model.states[row][col] = state
+        self._dirty_tiles.add((row, col))
+        self._schedule()
+
+    def set_key_state(self, letter, state):
+        if letter in self.key_items:
+            self.model.key_states[letter] = state
+            self._dirty_keys.add(letter)
+            self._schedule()
+
+    def reset(self):
+        self.model.reset()
+        self._dirty_tiles.update(self.tile_items)
+        self._dirty_keys.update(k for row in KEYBOARD_ROWS for k in row)
+        self._schedule()
+
+    def show(self):
+        self.visible = True
+        self.canvas.itemconfigure("board", state="normal")
+        self.canvas.tag_raise("board")
+        self._relayout = True
+        self._schedule()
+
+    def hide(self):
+        self.visible = False
+        self.canvas.itemconfigure("board", state="hidden")
+
+    def tile_position(self, row, col):
+        self.flush()
+        x0, y0, x1, _ = self.tile_box[(row, col)]
+        x = self.canvas.winfo_rootx() - self.root.winfo_rootx() + x0
+        y = self.canvas.winfo_rooty() - self.root.winfo_rooty() + y0
+        return int(x), int(y), int(x1 - x0)
+
+    # drawing
+    def _on_configure(self, event):
+        if (event.width, event.height) != self._size:
+            self._size = (event.width, event.height)
+            self._relayout = True
+            self._schedule()
+
+    def _schedule(self):
+        if self._flush_id is None:
+            self._flush_id = self.root.after_idle(self.flush)
+
+    @traced("board.flush")
+    def flush(self):
+        if self._flush_id is not None:
+            self.root.after_cancel(self._flush_id)
+            self._flush_id = None
+        if self._relayout:
+            self._relayout = False
+            self._layout()
+            self._dirty_tiles.update(self.tile_items)
+            self._dirty_keys.update(self.key_items)
+        c = self.canvas
+        for pos in self._dirty_tiles:
+            self._draw_tile(self.tile_items[pos], *self._tile_content(pos))
+        for k in self._dirty_keys:
+            rect, _ = self.key_items[k]
+            state = self.model.key_states.get(k)
+            if state is not None:
+                c.itemconfigure(rect, fill=self.colors[self.app.STATE_COLORS[state]])
+            elif k != ENTER:
+                c.itemconfigure(rect, fill=self.colors["key_default"])
+        self._dirty_tiles.clear()
+        self._dirty_keys.clear()
+
+    def _tile_content(self, pos):
+        r, col = pos
+        return self.model.letters[r][col], self.model.states[r][col]
+
+    def _draw_tile(self, items, letter, state):
+        c = self.canvas
+        rect, text = items
+        if state is None:
+            c.itemconfigure(rect, fill=self.colors["bg"], outline=self.colors["empty"])
+        else:
+            color = self.colors[self.app.STATE_COLORS[state]]
+            c.itemconfigure(rect, fill=color, outline=color)
+        c.itemconfigure(text, text=letter)
+
+    def _canvas_size(self):
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            width = self.root.winfo_screenwidth()
+            height = self.root.winfo_screenheight()
+        return width, height
+
+    def _layout(self):
+        c = self.canvas
+        width, height = self._canvas_size()
+        rows, cols = self.model.rows, self.model.cols
+        # tiles + keyboard take about 11 tile heights, keep the grid narrow
+        tile = max(16, min(height / 11.5, width / (cols * 2.6)))
+        gap = tile * 0.14
+        top = height * 0.04
+        left = (width - (cols * tile + (cols - 1) * gap)) / 2
+        tile_font = ("Clarendon BT", -int(tile * 0.5), "bold")
+        for (r, col), (rect, text) in self.tile_items.items():
+            x0 = left + col * (tile + gap)
+            y0 = top + r * (tile + gap)
+            self.tile_box[(r, col)] = (x0, y0, x0 + tile, y0 + tile)
+            c.coords(rect, x0, y0, x0 + tile, y0 + tile)
+            c.coords(text, x0 + tile / 2, y0 + tile / 2)
+            c.itemconfigure(text, font=tile_font)
+        self._layout_keys(width, top + rows * (tile + gap) + tile * 0.3, tile)
+
+    def _layout_keys(self, width, y, tile):
+        c = self.canvas
+        key_w = tile * 0.8
+        key_h = tile * 0.9
+        key_gap = tile * 0.1
+        key_font = ("Clarendon BT", -int(tile * 0.24), "bold")
+        for r, keys in enumerate(KEYBOARD_ROWS):
+            row_keys = [(k, key_w) for k in keys]
+            if r == 2:
+                row_keys += [(BACKSPACE, key_w * 1.5), (ENTER, key_w * 2)]
+            total = sum(w for _, w in row_keys) + key_gap * (len(row_keys) - 1)
+            x = (width - total) / 2
+            for k, w in row_keys:
+                rect, text = self.key_items[k]
+                self.key_boxes[k] = (x, y, x + w, y + key_h)
+                c.coords(rect, x, y, x + w, y + key_h)
+                c.coords(text, x + w / 2, y + key_h / 2)
+                c.itemconfigure(text, font=key_font)
+                x += w + key_gap
+            y += key_h + key_gap
+
+
+class MultiCanvasBoard(CanvasBoard):
+    # one grid per board of a MultiWordle plus the shared keyboard, all on
+    # the background canvas. Typed letters go to every board still being
+    # played; a reveal sets each board's tile in the same flush.
+    def __init__(self, app, canvas=None):
+        self.board_count = len(app.wordle.boards)
+        self.models = [
+            BoardModel(app.wordle.MAX_ATTEMPTS, app.wordle.WORD_LENGTH)
+            for _ in range(self.board_count)
+        ]
+        super().__init__(app, canvas)
+
+    def _create_tiles(self):
+        for b, model in enumerate(self.models):
+            for r in range(model.rows):
+                for col in range(model.cols):
+                    self.tile_items[(b, r, col)] = self._create_tile()
+
+    def set_letter(self, row, col, ch):
+        boards = self.app.wordle.boards
+        for b, model in enumerate(self.models):
+            if not boards[b].is_solved:
+                model.letters[row][col] = ch
+                self._dirty_tiles.add((b, row, col))
+        self._schedule()
+
+    def set_tile_states(self, row, col, ch, states):
+        # states: one per board, None where the board was already solved
+        for b, state in enumerate(states):
+            if state is not None:
+                model = self.models[b]
+                model.letters[row][col] = ch
+                model.states[row][col] = state
+                self._dirty_tiles.add((b, row, col))
+        self._schedule()
+
+    def set_tile_state(self, row, col, state):
+        self.set_tile_states(row, col, self.models[0].letters[row][col], [state] * self.board_count)
+
+    def reset(self):
+        for model in self.models:
+            model.reset()
+        self.model.reset()
+        self._dirty_tiles.update(self.tile_items)
+        self._dirty_keys.update(k for row in KEYBOARD_ROWS for k in row)
+        self._schedule()
+
+    def tile_position(self, row, col):
+        self.flush()
+        x0, y0, x1, _ = self.tile_box[(0, row, col)]
+        x = self.canvas.winfo_rootx() - self.root.winfo_rootx() + x0
+        y = self.canvas.winfo_rooty() - self.root.winfo_rooty() + y0
+        return int(x), int(y), int(x1 - x0)
+
+    def _tile_content(self, pos):
+        b, r, col = pos
+        model = self.models[b]
+        return model.letters[r][col], model.states[r][col]
+
+    def _layout(self):
+        c = self.canvas
+        width, height = self._canvas_size()
+        n = self.board_count
+        board_cols = n if n <= 4 else (4 if n <= 8 else 8)
+        board_rows = -(-n // board_cols)
+        rows, cols = self.models[0].rows, self.models[0].cols
+
+        # keyboard keeps a fixed share of the height, boards get the rest;
+        # the side text on the left of the game screen stays uncovered
+        key_unit = min(height * 0.075, width / 16)
+        keys_h = 3 * key_unit + key_unit * 0.3
+        top = height * 0.03
+        grid_h = height - top - keys_h - key_unit * 0.6
+        grid_w = width * 0.6
+        spacing = 1.12  # tile + gap, in tiles
+        board_gap = 0.8
+        tile = max(6, min(
+            grid_h / (board_rows * rows * spacing + (board_rows - 1) * board_gap),
+            grid_w / (board_cols * cols * spacing + (board_cols - 1) * board_gap),
+        ))
+        gap = tile * (spacing - 1)
+        board_w = cols * tile * spacing + tile * board_gap
+        board_h = rows * tile * spacing + tile * board_gap
+        left = (width - (board_cols * board_w - tile * board_gap)) / 2
+        tile_font = ("Clarendon BT", -max(6, int(tile * 0.5)), "bold")
+        border = 4 if tile >= 30 else (2 if tile >= 14 else 1)
+
+        for (b, r, col), (rect, text) in self.tile_items.items():
+            bx = left + (b % board_cols) * board_w
+            by = top + (b // board_cols) * board_h
+            x0 = bx + col * (tile + gap)
+            y0 = by + r * (tile + gap)
+            self.tile_box[(b, r, col)] = (x0, y0, x0 + tile, y0 + tile)
+            c.coords(rect, x0, y0, x0 + tile, y0 + tile)
+            c.coords(text, x0 + tile / 2, y0 + tile / 2)
+            c.itemconfigure(rect, width=border)
+            c.itemconfigure(text, font=tile_font)
+        self._layout_keys(width, top + board_rows * board_h, key_unit)
+
+
+RENDERERS = {
+    "widgets": WidgetBoard,
+    "canvas": CanvasBoard,
+    "multi": MultiCanvasBoard,
+}
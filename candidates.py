@@ -0,0 +1,167 @@
+import feedback
+from wordstore import iter_ids
+
+# candidate tracking
+#
+# Keeps the bitset of secrets still consistent with every guess so far.
+# Each feedback pattern compiles into a mask built from the word store's
+# position and letter-count bitsets, so narrowing is a few big-int ANDs
+# per turn instead of rescoring the remaining words.
+#
+# Hard mode keeps its own much smaller set of rules: revealed greens pin a
+# letter to a position and greens + yellows set a minimum count per letter.
+# They are compiled once per guess into a 26-bit allowed-letter mask per
+# position and a short list of minimum counts, so checking a word (or the
+# part typed so far) never depends on the size of the word list.
+
+
+def constraint_mask(store, word, code):
+    states = feedback.decode(code, len(word))
+    mask = store.all_mask
+    letters = {}
+    for p, (c, state) in enumerate(zip(word, states)):
+        at_p = store.position_mask(p, c)
+        if state == feedback.GREEN:
+            mask &= at_p
+        else:
+            mask &= ~at_p
+        seen = letters.setdefault(c, [0, False])
+        if state == feedback.GRAY:
+            seen[1] = True
+        else:
+            seen[0] += 1
+
+    # greens + yellows give the minimum count of a letter, a gray copy
+    # of the same letter caps it at exactly that many
+    for c, (found, capped) in letters.items():
+        if found:
+            mask &= store.count_mask(c, found)
+        if capped:
+            mask &= ~store.count_mask(c, found + 1)
+    return mask
+
+
+class CandidateTracker:
+    def __init__(self, store, mask=None):
+        self.store = store
+        self.reset(mask)
+
+    def reset(self, mask=None):
+        self.mask = self.store.all_mask if mask is None else mask
+        self.count = self.mask.bit_count()
+        self._ids = None
+        self._words = None
+
+    def apply(self, word, code, constraint=None):
+        # constraint: constraint_mask(store, word, code) when already known
+        if constraint is None:
+            constraint = constraint_mask(self.store, word, code)
+        mask = self.mask & constraint
+        if mask != self.mask:
+            self.mask = mask
+            self.count = mask.bit_count()
+            self._ids = None
+            self._words = None
+        return self.count
+
+    @property
+    def ids(self):
+        if self._ids is None:
+            self._ids = list(iter_ids(self.mask))
+        return self._ids
+
+    @property
+    def words(self):
+        if self._words is None:
+            words = self.store.words
+            self._words = [words[i] for i in self.ids]
+        return self._words
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, word):
+        word_id = self.store.id_of(word)
+        return word_id is not None and self.mask >> word_id & 1 == 1
+
+
+_ALL_LETTERS = (1 << 26) - 1
+_ORDINALS = ("1st", "2nd", "3rd", "4th", "5th", "6th", "7th", "8th")
+
+
+def _letter_bit(c):
+    return 1 << (ord(c) - 65) if "A" <= c <= "Z" else 0
+
+
+class HardModeRules:
+    def __init__(self, length):
+        self.length = length
+        self.reset()
+
+    def reset(self):
+        self.allowed = [_ALL_LETTERS] * self.length
+        self.greens = [None] * self.length
+        self.min_counts = {}
+
+    def update(self, word, code):
+        states = feedback.decode(code, len(word))
+        found = {}
+        for p, (c, state) in enumerate(zip(word, states)):
+            if state == feedback.GREEN:
+                self.greens[p] = c
+                self.allowed[p] = _letter_bit(c)
+            if state != feedback.GRAY:
+                found[c] = found.get(c, 0) + 1
+        for c, n in found.items():
+            if n > self.min_counts.get(c, 0):
+                self.min_counts[c] = n
+
+    def check(self, word):
+        # None when word keeps every revealed hint, else the reason it doesn't
+        return self.check_prefix(word) if len(word) == self.length else "incomplete guess"
+
+    def check_prefix(self, typed):
+        # same test for a guess still being typed: typed letters must fit
+        # the greens, and the required letters must still fit the gaps
+        allowed = self.allowed
+        for p, c in enumerate(typed):
+            if not allowed[p] & _letter_bit(c):
+                return f"{_ORDINALS[p]} letter must be {self.greens[p]}"
+        if not self.min_counts:
+            return None
+        # untyped green positions will hold their letter, the rest are free
+        free = 0
+        need = dict(self.min_counts)
+        for p in range(len(typed), self.length):
+            c = self.greens[p]
+            if c is None:
+                free += 1
+            elif c in need:
+                need[c] -= 1
+        missing = None
+        total = 0
+        for c, n in need.items():
+            n -= typed.count(c)
+            if n > 0:
+                total += n
+                missing = missing or c
+        if total > free:
+            return f"Guess must contain {missing}"
+        return None
+
+    def legal_mask(self, store):
+        # bitset of the dictionary words that keep every revealed hint
+        mask = store.all_mask
+        for p, c in enumerate(self.greens):
+            if c is not None:
+                mask &= store.position_mask(p, c)
+        for c, n in self.min_counts.items():
+            mask &= store.count_mask(c, n)
+        return mask
+
+    def legal_ids(self, store):
+        return list(iter_ids(self.legal_mask(store)))
+
+    def legal_words(self, store):
+        words = store.words
+        return [words[i] for i in iter_ids(self.legal_mask(store))]
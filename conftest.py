@@ -0,0 +1,23 @@
+import random
+
+import pytest
+
+import wordstore
+from wordstore import WordStore
+
+# shared test word lists: five and six letters from a small alphabet, so
+# repeated letters are common, plus a sample of the real five letter list
+
+
+def sample_words(length, count, seed):
+    rng = random.Random(seed)
+    words = {"".join(rng.choice("AEILNRST") for _ in range(length)) for _ in range(count)}
+    if length == wordstore.WORD_LENGTH:
+        real = list(wordstore.load_words())
+        words |= set(random.Random(seed).sample(real, min(200, len(real))))
+    return sorted(words)
+
+
+@pytest.fixture(params=[5, 6])
+def store(request):
+    return WordStore(sample_words(request.param, 300, request.param), request.param)
@@ -0,0 +1,219 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import simulate
+import wordstore
+from wordle_engine import Wordle
+
+# strategy evaluation
+#
+#   python evaluate.py --strategy entropy                 every secret, all cores
+#   python evaluate.py --strategy entropy --save-baseline
+#   python evaluate.py --strategy entropy --compare       exit 1 on regressions,
+#                                                         2 if there is no baseline
+#   python evaluate.py --compare --tolerance mean_guesses=0.05
+#
+# Plays every word of the list as the secret with one strategy (through
+# simulate.run's process pool) and reports mean/max guesses, failures, the
+# guess histogram, wall-clock time and how long each guess took to decide.
+#
+# A baseline file keeps one report per strategy, length and mode. A later
+# run is checked against it metric by metric: quality metrics may only get
+# worse by an absolute amount, timing metrics by a fraction. Timings are
+# taken inside busy workers, so their tolerances are loose by default.
+
+BASELINE_FILE = "eval_baseline.json"
+
+# metric -> (kind, default tolerance); every metric is lower-is-better
+TOLERANCES = {
+    "failures": ("abs", 0),
+    "mean_guesses": ("abs", 0.02),
+    "max_guesses": ("abs", 0),
+    "decision_mean_ms": ("ratio", 0.5),
+    "decision_p99_ms": ("ratio", 0.5),
+    "seconds": ("ratio", 0.5),
+}
+
+
+def run_key(strategy, length=wordstore.WORD_LENGTH, hard_mode=False):
+    key = strategy
+    if length != wordstore.WORD_LENGTH:
+        key += f":{length}"
+    if hard_mode:
+        key += ":hard"
+    return key
+
+
+def _bucket_order(item):
+    # guess counts numerically (10 after 9), failures last
+    bucket = item[0]
+    return (True, 0) if bucket == "X" else (False, int(bucket))
+
+
+def _percentile(samples, p):
+    return samples[min(len(samples) - 1, int(len(samples) * p))] if samples else 0.0
+
+
+def evaluate(strategy="entropy", length=wordstore.WORD_LENGTH, hard_mode=False, workers=None,
+             games=None, seed=None, chunk_size=16):
+    histogram = {}
+    decisions = []
+    stats = {"failures": 0, "max_guesses": 0, "solved_guesses": 0}
+
+    def on_result(result):
+        count = len(result["guesses"])
+        decisions.extend(result["decision_ms"])
+        if result["solved"]:
+            bucket = str(count)
+            stats["max_guesses"] = max(stats["max_guesses"], count)
+            stats["solved_guesses"] += count
+        else:
+            bucket = "X"
+            stats["failures"] += 1
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+
+    summary = simulate.run(strategy, games, workers, seed=seed, chunk_size=chunk_size,
+                           length=length, hard_mode=hard_mode, on_result=on_result)
+    decisions.sort()
+    played = summary["games"]
+    solved = played - stats["failures"]
+    return {
+        "strategy": strategy,
+        "length": length,
+        "hard": hard_mode,
+        "games": played,
+        "failures": stats["failures"],
+        # failed games count as one guess past the limit
+        "mean_guesses": (stats["solved_guesses"] + stats["failures"] * (Wordle.MAX_ATTEMPTS + 1))
+                        / played if played else 0.0,
+        "mean_solved": stats["solved_guesses"] / solved if solved else 0.0,
+        "max_guesses": stats["max_guesses"],
+        "histogram": dict(sorted(histogram.items(), key=_bucket_order)),
+        "seconds": summary["seconds"],
+        "workers": workers or os.cpu_count() or 1,
+        "decisions": len(decisions),
+        "decision_mean_ms": sum(decisions) / len(decisions) if decisions else 0.0,
+        "decision_p50_ms": _percentile(decisions, 0.50),
+        "decision_p99_ms": _percentile(decisions, 0.99),
+        "decision_max_ms": decisions[-1] if decisions else 0.0,
+    }
+
+
+def compare(report, baseline, overrides=None):
+    # [(metric, new, old, limit)] for every metric past its tolerance
+    overrides = overrides or {}
+    regressions = []
+    for metric, (kind, default) in TOLERANCES.items():
+        old = baseline.get(metric)
+        new = report.get(metric)
+        if old is None or new is None:
+            continue
+        tolerance = overrides.get(metric, default)
+        limit = old + tolerance if kind == "abs" else old * (1 + tolerance)
+        if new > limit + 1e-9:
+            regressions.append((metric, new, old, limit))
+    return regressions
+
+
+def load_baseline(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f).get("runs", {})
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path, key, report):
+    runs = load_baseline(path)
+    runs[key] = report
+    data = {"python": platform.python_version(), "platform": platform.platform(),
+            "saved_at": time.strftime("%Y-%m-%d %H:%M:%S"), "runs": runs}
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+def print_report(r):
+    print(f"{r['strategy']}  length {r['length']}{'  hard mode' if r['hard'] else ''}")
+    print(f"games: {r['games']}  failures: {r['failures']}  "
+          f"mean guesses: {r['mean_guesses']:.4f} (solved only {r['mean_solved']:.4f})  "
+          f"max: {r['max_guesses']}")
+    total = r["games"] or 1
+    for bucket, count in r["histogram"].items():
+        print(f"{bucket:>2} {count:>7} {'#' * round(count / total * 50)}")
+    print(f"time: {r['seconds']:.2f}s on {r['workers']} workers")
+    print(f"decision: mean {r['decision_mean_ms']:.2f}ms  p50 {r['decision_p50_ms']:.2f}ms  "
+          f"p99 {r['decision_p99_ms']:.2f}ms  max {r['decision_max_ms']:.2f}ms  "
+          f"({r['decisions']} guesses)")
+
+
+def parse_tolerances(items):
+    overrides = {}
+    for item in items or []:
+        name, _, value = item.partition("=")
+        if name not in TOLERANCES:
+            raise ValueError(f"unknown metric: {name} (one of {', '.join(TOLERANCES)})")
+        overrides[name] = float(value)
+    return overrides
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate a hint strategy on every secret.")
+    parser.add_argument("--strategy", default="entropy",
+                        help="built-in strategy (%s) or module:function" % ", ".join(simulate.STRATEGIES))
+    parser.add_argument("--length", type=int, default=wordstore.WORD_LENGTH, help="word length")
+    parser.add_argument("--hard", action="store_true", help="play in hard mode")
+    parser.add_argument("--workers", type=int, default=None, help="default: every core")
+    parser.add_argument("--games", type=int, default=None, help="sample this many secrets instead")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true", help="exit 1 on regressions, 2 without a baseline")
+    parser.add_argument("--tolerance", action="append", metavar="METRIC=VALUE",
+                        help="override a tolerance: %s" % ", ".join(
+                            f"{m} ({'+' if k == 'abs' else 'x'}{d})" for m, (k, d) in TOLERANCES.items()))
+    args = parser.parse_args(argv)
+
+    try:
+        overrides = parse_tolerances(args.tolerance)
+    except ValueError as e:
+        parser.error(str(e))
+    report = evaluate(args.strategy, args.length, args.hard, args.workers, args.games, args.seed)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    key = run_key(args.strategy, args.length, args.hard)
+    if args.save_baseline:
+        save_baseline(args.baseline, key, report)
+        print(f"baseline for {key} saved to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline).get(key)
+    if baseline is None:
+        if args.compare:
+            # a gate with nothing to compare against must not pass
+            print(f"no baseline for {key} in {args.baseline}, run with --save-baseline first")
+            return 2
+        return 0
+    if baseline.get("games") != report["games"]:
+        print(f"warning: baseline played {baseline.get('games')} games, this run {report['games']}")
+    regressions = compare(report, baseline, overrides)
+    for metric, new, old, limit in regressions:
+        print(f"REGRESSION {metric}: {new:.4g} (baseline {old:.4g}, limit {limit:.4g})")
+    if not regressions:
+        print(f"within tolerance of the {key} baseline")
+    if args.compare and regressions:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,382 @@
+import os
+import sys
+from array import array
+from collections import Counter, OrderedDict
+from operator import itemgetter
+
+from wordstore import WORD_LENGTH, get_store
+
+# feedback engine
+#
+# Every guess/secret pair of the word list is scored once and kept in a
+# guess x secret matrix of pattern codes. A code packs the per-letter
+# result in base 3, position 0 being the least significant digit:
+#   0 = gray, 1 = yellow (in word), 2 = green (in position)
+# so a five letter pattern always fits in one byte (0..242). Six letters
+# and up need two bytes per code; those rows are array("H") instead of
+# bytes.
+#
+# Each word length has its own table. Lists too big for a full matrix
+# (more than DENSE_LIMIT bytes) score rows on demand and keep the most
+# recent ROW_CACHE of them.
+
+GRAY = 0
+YELLOW = 1
+GREEN = 2
+
+CACHE_DIR = "cache"
+DENSE_LIMIT = 64 * 1024 * 1024
+ROW_CACHE = 256
+
+_MAGIC = b"WDLFB1"
+_POW3 = [3 ** i for i in range(8 + 1)]
+PATTERN_COUNT = 3 ** WORD_LENGTH
+SOLVED = PATTERN_COUNT - 1
+
+
+def solved_code(length=WORD_LENGTH):
+    return 3 ** length - 1
+
+
+def code_width(length=WORD_LENGTH):
+    # bytes per pattern code
+    return 1 if 3 ** length <= 256 else 2
+
+
+def score(guess, secret):
+    # reference scorer, same rules as the original Wordle.guess loop
+    code = 0
+    remaining = list(secret)
+    greens = [False] * len(guess)
+    for i, ch in enumerate(guess):
+        if ch == remaining[i]:
+            greens[i] = True
+            remaining[i] = None
+            code += GREEN * 3 ** i
+    for i, ch in enumerate(guess):
+        if greens[i]:
+            continue
+        if ch in remaining:
+            remaining[remaining.index(ch)] = None
+            code += YELLOW * 3 ** i
+    return code
+
+
+def _decode(code, length):
+    states = []
+    for _ in range(length):
+        states.append(code % 3)
+        code //= 3
+    return tuple(states)
+
+
+_DECODED = [_decode(code, WORD_LENGTH) for code in range(PATTERN_COUNT)]
+
+
+def decode(code, length=WORD_LENGTH):
+    # pattern code -> tuple of per-letter states (GRAY/YELLOW/GREEN)
+    if length == WORD_LENGTH:
+        return _DECODED[code]
+    return _decode(code, length)
+
+
+def encode(states):
+    return sum(state * 3 ** i for i, state in enumerate(states))
+
+
+def _lanes(flags, width=1):
+    # one byte (or two byte) lane per secret, so the whole column of
+    # secrets can be scored with a handful of big integer operations
+    if width == 1:
+        return int.from_bytes(bytes(flags), "little")
+    buf = bytearray(len(flags) * width)
+    buf[::width] = bytes(flags)
+    return int.from_bytes(buf, "little")
+
+
+_BITS_TO_LANES = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _mask_lanes(mask, size, width=1):
+    # bitset over word ids -> the same flags as lanes, without a Python loop
+    flags = format(mask, f"0{size}b")[::-1].encode("ascii").translate(_BITS_TO_LANES)
+    if width == 1:
+        return int.from_bytes(flags, "little")
+    buf = bytearray(size * width)
+    buf[::width] = flags
+    return int.from_bytes(buf, "little")
+
+
+def as_codes(data, width):
+    # raw little-endian row/matrix bytes -> indexable pattern codes
+    if width == 1:
+        return data
+    codes = array("H")
+    codes.frombytes(data)
+    if sys.byteorder == "big":
+        codes.byteswap()
+    return codes
+
+
+def _pack_codes(codes, width):
+    return bytes(codes) if width == 1 else array("H", codes)
+
+
+def partition(row, candidate_ids=None):
+    # bucket sizes per pattern code for one guess row; the gather and the
+    # count both run in C, so a few thousand candidates take well under 1ms
+    if candidate_ids is None:
+        return Counter(row)
+    if len(candidate_ids) < 2:
+        return Counter(row[i] for i in candidate_ids)
+    return Counter(itemgetter(*candidate_ids)(row))
+
+
+class RowScorer:
+    # scores one guess against every word of the list at once; with a
+    # store the lanes come from its prebuilt bitsets
+    def __init__(self, words, length=None, store=None):
+        self.words = words
+        self.size = len(words)
+        self.length = length or (len(words[0]) if words else WORD_LENGTH)
+        self.width = code_width(self.length)
+        width = self.width
+
+        if store is not None:
+            n = self.size
+            self.at_pos = [
+                {c: _mask_lanes(mask, n, width) for c, mask in masks.items()}
+                for masks in store.position_masks
+            ]
+            self.at_least = {
+                c: [_mask_lanes(mask, n, width) for mask in masks]
+                for c, masks in store.count_masks.items()
+            }
+        else:
+            letters = set("".join(words))
+            self.at_pos = [
+                {c: _lanes([w[i] == c for w in words], width) for c in letters}
+                for i in range(self.length)
+            ]
+            # at_least[c][m]: secrets containing letter c at least m times
+            self.at_least = {
+                c: [_lanes([w.count(c) >= m for w in words], width) for m in range(self.length + 1)]
+                for c in letters
+            }
+        self.full = _lanes([1] * self.size, width)
+
+    def row_bytes(self, guess):
+        at_pos = self.at_pos
+        at_least = self.at_least
+        full = self.full
+        groups = {}
+        for i, c in enumerate(guess):
+            groups.setdefault(c, []).append(i)
+
+        total = 0
+        for c, positions in groups.items():
+            greens = [at_pos[p].get(c, 0) for p in positions]
+            counts = at_least.get(c)
+            if counts is None:
+                continue
+            for p, green in zip(positions, greens):
+                total += GREEN * _POW3[p] * green
+
+            if len(positions) == 1:
+                # yellow wherever the secret has the letter but not here
+                total += _POW3[positions[0]] * (counts[1] ^ greens[0])
+                continue
+
+            # repeated letter: split secrets by which of these positions
+            # are green, then hand out yellows left to right while the
+            # secret still has unmatched copies of the letter
+            k = len(positions)
+            for subset in range(1 << k):
+                mask = full
+                free = []
+                for j in range(k):
+                    if subset >> j & 1:
+                        mask &= greens[j]
+                    else:
+                        mask &= full ^ greens[j]
+                        free.append(positions[j])
+                    if not mask:
+                        break
+                if not mask:
+                    continue
+                used = k - len(free)
+                for extra, p in enumerate(free, 1):
+                    yellow = mask & counts[used + extra]
+                    if not yellow:
+                        break
+                    total += _POW3[p] * yellow
+
+        return total.to_bytes(self.size * self.width, "little")
+
+    def row(self, guess):
+        return as_codes(self.row_bytes(guess), self.width)
+
+
+def build_matrix(words, length=None, store=None):
+    # raw little-endian codes, guess-major
+    n = len(words)
+    if n == 0:
+        return bytearray()
+    scorer = RowScorer(words, length, store)
+    step = n * scorer.width
+    matrix = bytearray(n * step)
+    for g, guess in enumerate(words):
+        matrix[g * step:(g + 1) * step] = scorer.row_bytes(guess)
+    return matrix
+
+
+class FeedbackTable:
+    def __init__(self, store, cache_path=None):
+        self.store = store
+        self.words = store.words
+        self.index = store.ids
+        self.size = store.size
+        self.length = store.length
+        self.width = code_width(self.length)
+        self.word_hash = store.word_hash
+        self.cache_path = cache_path
+        self.dense = self.size * self.size * self.width <= DENSE_LIMIT
+        self._matrix = None
+        self._scorer = None
+        self._rows = OrderedDict()
+
+    def _codes(self, codes):
+        return _pack_codes(codes, self.width)
+
+    @property
+    def matrix(self):
+        # None for lists scored row by row
+        if self._matrix is None and self.dense:
+            self._matrix = self._load() or self._build()
+        return self._matrix
+
+    def _load(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        head = len(_MAGIC) + 32 + 4
+        if (
+            data[:len(_MAGIC)] != _MAGIC
+            or data[len(_MAGIC):len(_MAGIC) + 32] != self.word_hash
+            or int.from_bytes(data[head - 4:head], "little") != self.size
+            or len(data) != head + self.size * self.size * self.width
+        ):
+            return None
+        return as_codes(memoryview(data)[head:], self.width)
+
+    def _build(self):
+        matrix = build_matrix(self.words, self.length, self.store)
+        if self.cache_path:
+            self._save(matrix)
+        return as_codes(matrix, self.width)
+
+    def _save(self, matrix):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(_MAGIC)
+                f.write(self.word_hash)
+                f.write(self.size.to_bytes(4, "little"))
+                f.write(matrix)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+
+    def row(self, guess_id):
+        if self.dense:
+            return self.matrix[guess_id * self.size:(guess_id + 1) * self.size]
+        row = self._rows.get(guess_id)
+        if row is not None:
+            self._rows.move_to_end(guess_id)
+            return row
+        if self._scorer is None:
+            self._scorer = RowScorer(self.words, self.length, self.store)
+        row = self._scorer.row(self.words[guess_id])
+        self._rows[guess_id] = row
+        if len(self._rows) > ROW_CACHE:
+            self._rows.popitem(last=False)
+        return row
+
+    def column(self, secret_id):
+        if self.dense:
+            return self.matrix[secret_id::self.size]
+        secret = self.words[secret_id]
+        return self._codes(score(g, secret) for g in self.words)
+
+    def pattern(self, guess, secret):
+        g = self.index.get(guess)
+        s = self.index.get(secret)
+        if g is None or s is None:
+            return score(guess, secret)
+        if not self.dense:
+            row = self._rows.get(g)
+            return score(guess, secret) if row is None else row[s]
+        return self.matrix[g * self.size + s]
+
+    def score_guess(self, guess, secrets=None):
+        # one guess against many secrets (the whole list when secrets is None)
+        g = self.index.get(guess)
+        if secrets is None:
+            if g is None:
+                return self._codes(score(guess, s) for s in self.words)
+            return self._codes(self.row(g))
+        if g is None:
+            return self._codes(score(guess, s) for s in secrets)
+        row = self.row(g)
+        index = self.index
+        return self._codes(row[index[s]] if s in index else score(guess, s) for s in secrets)
+
+    def score_ids(self, guess_id, secret_ids):
+        # one guess against a handful of secrets by id, e.g. multi-board
+        if not secret_ids:
+            return self._codes(())
+        gather = itemgetter(*secret_ids)
+        codes = gather(self.row(guess_id))
+        return self._codes(codes if len(secret_ids) > 1 else (codes,))
+
+    def score_secret(self, guesses, secret):
+        # many guesses against one secret
+        s = self.index.get(secret)
+        if s is None or not self.dense:
+            return self._codes(score(g, secret) for g in guesses)
+        column = self.column(s)
+        index = self.index
+        return self._codes(column[index[g]] if g in index else score(g, secret) for g in guesses)
+
+
+_tables = {}
+
+
+def table_path(length=WORD_LENGTH):
+    name = "feedback.bin" if length == WORD_LENGTH else f"feedback_{length}.bin"
+    return os.path.join(CACHE_DIR, name)
+
+
+def get_table(length=WORD_LENGTH):
+    table = _tables.get(length)
+    if table is None:
+        table = FeedbackTable(get_store(length), cache_path=table_path(length))
+        _tables[length] = table
+    return table
+
+
+def pattern(guess, secret):
+    return get_table(len(secret)).pattern(guess, secret)
+
+
+def score_guess(guess, secrets=None):
+    return get_table(len(guess)).score_guess(guess, secrets)
+
+
+def score_secret(guesses, secret):
+    return get_table(len(secret)).score_secret(guesses, secret)
@@ -0,0 +1,186 @@
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+import wordstore
+from server import read_frame, ws_frame
+
+# load generator for server.py
+#
+#   python loadgen.py --spawn --clients 500 --games 5000
+#   python loadgen.py --port 8765 --ws
+#
+# Every client keeps one connection open and plays games back to back,
+# guessing random words from the list, until --games games have been
+# played. Latency is measured per request; the summary gives p50/p99,
+# requests per second and guesses per second. --spawn starts a server in
+# a subprocess on a free port first.
+
+
+class HttpClient:
+    def __init__(self, reader, writer, host):
+        self.reader = reader
+        self.writer = writer
+        self.host = host
+
+    async def request(self, method, path, data=None):
+        body = json.dumps(data).encode() if data is not None else b""
+        self.writer.write((
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+        ).encode() + body)
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    async def new_game(self):
+        return await self.request("POST", "/games", {})
+
+    async def guess(self, game_id, word):
+        return await self.request("POST", f"/games/{game_id}/guess", {"word": word})
+
+
+class WsClient(HttpClient):
+    async def handshake(self):
+        key = base64.b64encode(os.urandom(16)).decode()
+        self.writer.write((
+            f"GET /ws HTTP/1.1\r\nHost: {self.host}\r\nUpgrade: websocket\r\n"
+            f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n\r\n"
+        ).encode())
+        await self.writer.drain()
+        while (await self.reader.readline()) not in (b"\r\n", b""):
+            pass
+
+    async def send(self, message):
+        self.writer.write(ws_frame(json.dumps(message).encode(), mask=os.urandom(4)))
+        await self.writer.drain()
+        _, payload = await read_frame(self.reader)
+        data = json.loads(payload)
+        return data.pop("status"), data
+
+    async def new_game(self):
+        return await self.send({"op": "new"})
+
+    async def guess(self, game_id, word):
+        return await self.send({"op": "guess", "id": game_id, "word": word})
+
+
+async def client(host, port, use_ws, words, quota, latencies, totals, seed):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    conn = (WsClient if use_ws else HttpClient)(reader, writer, host)
+    if use_ws:
+        await conn.handshake()
+    try:
+        while quota["left"] > 0:
+            quota["left"] -= 1
+            start = time.perf_counter()
+            status, game = await conn.new_game()
+            latencies.append(time.perf_counter() - start)
+            if status != 201:
+                totals["errors"] += 1
+                continue
+            while True:
+                start = time.perf_counter()
+                status, state = await conn.guess(game["id"], rng.choice(words))
+                latencies.append(time.perf_counter() - start)
+                if status != 200:
+                    totals["errors"] += 1
+                    break
+                totals["guesses"] += 1
+                if state["solved"] or not state["remaining"]:
+                    totals["games"] += 1
+                    break
+    finally:
+        writer.close()
+
+
+async def run(host, port, clients, games, use_ws=False, seed=0):
+    words = wordstore.get_store().words
+    latencies = []
+    totals = {"games": 0, "guesses": 0, "errors": 0}
+    quota = {"left": games}
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(host, port, use_ws, words, quota, latencies, totals, seed * 7919 + i)
+        for i in range(clients)
+    ))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0.0
+
+    return dict(
+        totals,
+        requests=len(latencies),
+        seconds=elapsed,
+        p50_ms=pct(0.50),
+        p99_ms=pct(0.99),
+        requests_per_second=len(latencies) / elapsed if elapsed else 0.0,
+        guesses_per_second=totals["guesses"] / elapsed if elapsed else 0.0,
+    )
+
+
+def spawn_server(host):
+    with socket.socket() as s:
+        s.bind((host, 0))
+        port = s.getsockname()[1]
+    proc = subprocess.Popen([sys.executable, "server.py", "--host", host, "--port", str(port)],
+                            stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=0.5).close()
+            return proc, port
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("server did not start")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test server.py.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=200, help="concurrent connections")
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--ws", action="store_true", help="use the WebSocket endpoint")
+    parser.add_argument("--spawn", action="store_true", help="start a local server first")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    proc = None
+    port = args.port
+    if args.spawn:
+        proc, port = spawn_server(args.host)
+    try:
+        s = asyncio.run(run(args.host, port, args.clients, args.games, args.ws, args.seed))
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait()
+    print(f"games: {s['games']}  guesses: {s['guesses']}  requests: {s['requests']}  errors: {s['errors']}")
+    print(f"latency p50: {s['p50_ms']:.2f}ms  p99: {s['p99_ms']:.2f}ms")
+    print(f"throughput: {s['requests_per_second']:.0f} req/s  {s['guesses_per_second']:.0f} guesses/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,36 +1,85 @@
+import time
+
+_T0 = time.perf_counter()
+
+import sys
 import tkinter as tk
-from wordle_tkinter import *
-from PIL import Image, ImageTk
-from sound import *
+
+from assets import get_cache, get_image, prefetch_image
+from sound import get_sound, preload_sound_manager
+from screens import ScreenManager
+import profiler
+from profiler import traced
+
+# staged startup
+#
+# The menu's first frame is a plain canvas with the buttons on it. Only
+# after that has been painted does the menu wait for its background,
+# which is decoded and resized on a worker thread. The mixer and pygame
+# load in the background, and the game screen (wordle_tkinter, the word
+# store and the solver) is built while the player is still on the menu.
+# python main.py --startup-report prints when each stage finished.
+
+STARTUP_REPORT = False
+_stages = []
+_imports = []
+
+
+def stage(name):
+    _stages.append((name, time.perf_counter() - _T0))
+    profiler.record_since(f"startup.{name}", _T0, "startup")
+
+
+def print_startup_report():
+    print(f"{'stage':<24}{'at':>10}{'took':>10}")
+    last = 0.0
+    for name, at in sorted(_stages, key=lambda s: s[1]):
+        print(f"{name:<24}{at * 1000:>8.1f}ms{(at - last) * 1000:>8.1f}ms")
+        last = at
+    for name, took in _imports:
+        print(f"import {name:<17}{took * 1000:>18.1f}ms")
+
+
+def _game_screen(root, screens):
+    start = time.perf_counter()
+    from wordle_tkinter import game_screen
+    _imports.append(("wordle_tkinter", time.perf_counter() - start))
+    return game_screen(root, screens)
+
 
 class MainMenu:
-    def __init__(self, root):
+    MENU_BG = "images/bg_fix.png"
+    GAME_BG = "images/bg_game.png"
+
+    @traced("menu.init")
+    def __init__(self, root, screens=None):
         self.root = root
-        self.root.title("Wordle Menu")
-        self.root.attributes("-fullscreen", True)
-        def exit_fullscreen(event=None):
-            self.root.attributes("-fullscreen", False)
-        self.root.bind("<Escape>", exit_fullscreen)
+        standalone = screens is None
+        if standalone:
+            screens = ScreenManager(root)
+            screens.register("game", _game_screen)
+            screens.adopt("menu", self)
+        self.screens = screens
 
-        self.sound = SoundManager()
-        self.sound.play_menu_music()
+        self.sound = get_sound()
+        preload_sound_manager(on_ready=lambda: stage("sound ready"))
 
 
-        self.canvas = tk.Canvas(root, width=1920, height=1080, highlightthickness=0)
-        self.canvas.place(x=0, y=0, relwidth=1, relheight=1)
+        self.canvas = tk.Canvas(root, width=1920, height=1080, highlightthickness=0, bg="#3a0ca3")
 
         screen_w = self.root.winfo_screenwidth()
         screen_h = self.root.winfo_screenheight()
 
-        bg = Image.open("images/bg_fix.png")
-        bg = bg.resize((screen_w, screen_h), Image.LANCZOS)
-        self.bg_img = ImageTk.PhotoImage(bg)
-
-        self.canvas.create_image(0, 0, anchor="nw", image=self.bg_img)
+        # backgrounds are resized off the Tk thread, see _stage_background
+        self.bg_size = (screen_w, screen_h)
+        prefetch_image(self.MENU_BG, self.bg_size)
+        prefetch_image(self.GAME_BG, self.bg_size)
+        self.bg_img = None
+        self.bg_item = self.canvas.create_image(0, 0, anchor="nw")
 
-        self.btn_play_img = tk.PhotoImage(file="images/btn_play.png")
-        self.btn_instr_img = tk.PhotoImage(file="images/btn_instruction.png")
-        self.btn_exit_img = tk.PhotoImage(file="images/btn_exit.png")
+        self.btn_play_img = get_image("images/btn_play.png")
+        self.btn_instr_img = get_image("images/btn_instruction.png")
+        self.btn_exit_img = get_image("images/btn_exit.png")
 
         center_x = self.root.winfo_screenwidth() // 2
         self.play_btn = self.canvas.create_image(center_x, 270, image=self.btn_play_img)
@@ -42,12 +91,55 @@ class MainMenu:
         self.canvas.tag_bind(self.instr_btn, "<Button-1>", self.show_instructions)
         self.canvas.tag_bind(self.exit_btn, "<Button-1>", self.exit_game)
 
+        if standalone:
+            self.show()
+        self.root.after_idle(self._stage_background)
+
+    def _stage_background(self):
+        # wait for the worker thread without blocking the menu
+        cache = get_cache()
+        if not cache.ready(self.MENU_BG, self.bg_size) and not cache.failed(self.MENU_BG, self.bg_size):
+            self.root.after(15, self._stage_background)
+            return
+        try:
+            # a failed prefetch is retried here, so the real error surfaces
+            self.bg_img = get_image(self.MENU_BG, self.bg_size)
+        except Exception as e:
+            print(f"menu: no background image: {e}")
+        else:
+            self.canvas.itemconfigure(self.bg_item, image=self.bg_img)
+            self.canvas.tag_lower(self.bg_item)
+        stage("menu background")
+        self.root.after(50, self._stage_game)
+
+    def _stage_game(self):
+        # build the game screen now so Play only has to show it
+        cache = get_cache()
+        if not cache.ready(self.GAME_BG, self.bg_size) and not cache.failed(self.GAME_BG, self.bg_size):
+            self.root.after(15, self._stage_game)
+            return
+        # after a failed prefetch the game loads its background itself
+        self.screens.get("game")
+        stage("game preloaded")
+        if STARTUP_REPORT:
+            print_startup_report()
+
+    def show(self):
+        self.root.title("Wordle Menu")
+        self.root.attributes("-fullscreen", True)
+        def exit_fullscreen(event=None):
+            self.root.attributes("-fullscreen", False)
+        self.root.bind("<Escape>", exit_fullscreen)
+        self.canvas.place(x=0, y=0, relwidth=1, relheight=1)
+        self.canvas.lift()
+        self.sound.play_menu_music()
+
+    def hide(self):
+        self.canvas.place_forget()
+
     
     def start_game(self, event=None):
-        self.canvas.place_forget()
-        self.sound.stop_music()
-        WordleApp(self.root)
-        self.sound.play_game_music()
+        self.screens.show("game")
 
     def show_instructions(self, event=None):
         self.open_instruction_window()
@@ -72,9 +164,7 @@ class MainMenu:
 
         popup.geometry(f"{popup_width}x{popup_height}+{x}+{y}")
 
-        bg = Image.open("images/bg_ins.png")
-        bg = bg.resize((popup_width, popup_height), Image.LANCZOS)
-        popup.bg_image = ImageTk.PhotoImage(bg)
+        popup.bg_image = get_image("images/bg_ins.png", (popup_width, popup_height))
 
         
         popup.canvas = tk.Canvas(popup, width=popup_width, height=popup_height, highlightthickness=0)
@@ -118,7 +208,7 @@ class MainMenu:
         )
 
 
-        popup.btn_next = tk.PhotoImage(file="images/btn_next.png")
+        popup.btn_next = get_image("images/btn_next.png")
         popup.next_btn = popup.canvas.create_image(700, 500, image=popup.btn_next)
         popup.canvas.tag_bind(popup.next_btn, "<Button-1>", lambda e: self.next(popup))
         
@@ -145,9 +235,7 @@ class MainMenu:
 
         popup.geometry(f"{popup_width}x{popup_height}+{x}+{y}")
 
-        bg = Image.open("images/bg_ins.png")
-        bg = bg.resize((popup_width, popup_height), Image.LANCZOS)
-        popup.bg_image = ImageTk.PhotoImage(bg)
+        popup.bg_image = get_image("images/bg_ins.png", (popup_width, popup_height))
 
         
         popup.canvas = tk.Canvas(popup, width=popup_width, height=popup_height, highlightthickness=0)
@@ -191,16 +279,16 @@ class MainMenu:
             fill="#abc7cc"
         )
 
-        popup.ins_1 = tk.PhotoImage(file="images/ins_1.png")
+        popup.ins_1 = get_image("images/ins_1.png")
         popup.inst_1 = popup.canvas.create_image(200, 170, image=popup.ins_1)
 
-        popup.ins_2 = tk.PhotoImage(file="images/ins_2.png")
+        popup.ins_2 = get_image("images/ins_2.png")
         popup.inst_2 = popup.canvas.create_image(200, 270, image=popup.ins_2)
 
-        popup.ins_3 = tk.PhotoImage(file="images/ins_3.png")
+        popup.ins_3 = get_image("images/ins_3.png")
         popup.inst_3 = popup.canvas.create_image(200, 370, image=popup.ins_3)
 
-        popup.btn_close = tk.PhotoImage(file="images/close.png")
+        popup.btn_close = get_image("images/close.png")
         popup.close_btn = popup.canvas.create_image(700, 500, image=popup.btn_close)
         popup.canvas.tag_bind(popup.close_btn, "<Button-1>", lambda e: popup.destroy())
 
@@ -209,7 +297,21 @@ class MainMenu:
 
 
 if __name__ == "__main__":
+    # --profile [trace.json] turns on the profiler, same as WORDLE_PROFILE
+    if "--profile" in sys.argv:
+        i = sys.argv.index("--profile")
+        path = sys.argv[i + 1] if i + 1 < len(sys.argv) and not sys.argv[i + 1].startswith("-") else None
+        profiler.enable(path)
+    STARTUP_REPORT = "--startup-report" in sys.argv
+    stage("imports")
     root = tk.Tk()
-    app = MainMenu(root)
+    profiler.watch_tk(root)
+    profiler.mark_startup(root)
+    stage("tk")
+    screens = ScreenManager(root)
+    screens.register("menu", MainMenu)
+    screens.register("game", _game_screen)
+    screens.show("menu")
+    root.update_idletasks()
+    stage("first frame")
     root.mainloop()
-
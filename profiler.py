@@ -0,0 +1,198 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from functools import wraps
+
+# opt-in profiling
+#
+# Off unless WORDLE_PROFILE is set (1 or an output path) or main.py runs
+# with --profile. When off, traced functions cost one flag check and
+# span() hands back a shared no-op context.
+#
+# When on, every span (name, start, duration, thread) goes into a ring
+# buffer of the last CAPACITY events; Tk after/after_idle callbacks are
+# timed too, along with how late they ran. On exit the buffer is written
+# as Chrome trace JSON (chrome://tracing or ui.perfetto.dev) and a
+# per-span summary is printed.
+
+CAPACITY = 100000
+DEFAULT_TRACE = "wordle_trace.json"
+
+ENABLED = False
+_T0 = time.perf_counter_ns()  # roughly process start, for the startup span
+_events = deque(maxlen=CAPACITY)
+_path = DEFAULT_TRACE
+_null = nullcontext()
+
+
+def enable(path=None, capacity=CAPACITY):
+    global ENABLED, _events, _path
+    if ENABLED:
+        return
+    ENABLED = True
+    _path = path or DEFAULT_TRACE
+    _events = deque(_events, maxlen=capacity)
+    atexit.register(_on_exit)
+
+
+def _now():
+    return time.perf_counter_ns()
+
+
+def record(name, start_ns, end_ns, cat="app", args=None):
+    if ENABLED:
+        _events.append((name, cat, start_ns, end_ns - start_ns, threading.get_ident(), args))
+
+
+def record_since(name, start_s, cat="app", args=None):
+    # start given as a time.perf_counter() reading
+    if ENABLED:
+        record(name, int(start_s * 1e9), _now(), cat, args)
+
+
+class _Span:
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name, cat, args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = _now()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, self.start, _now(), self.cat, self.args)
+        return False
+
+
+def span(name, cat="app", **args):
+    if not ENABLED:
+        return _null
+    return _Span(name, cat, args or None)
+
+
+def traced(name=None, cat="app"):
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        @wraps(fn)
+        def wrapper(*a, **kw):
+            if not ENABLED:
+                return fn(*a, **kw)
+            start = _now()
+            try:
+                return fn(*a, **kw)
+            finally:
+                record(label, start, _now(), cat)
+        return wrapper
+    return decorate
+
+
+def mark_startup(root):
+    # startup = profiler import until the first idle pass after it
+    if ENABLED:
+        root.after_idle(lambda: record("startup", _T0, _now(), "startup"))
+
+
+def watch_tk(root):
+    # time every root.after / after_idle callback and how late it ran
+    if not ENABLED or getattr(root, "_profiled", False):
+        return
+    after = root.after
+    after_idle = root.after_idle
+
+    def timed(callback, due, kind):
+        label = getattr(callback, "__qualname__", None) or repr(callback)
+
+        def run(*a):
+            start = _now()
+            try:
+                return callback(*a)
+            finally:
+                record(f"{kind}:{label}", start, _now(), "tk",
+                       {"late_ms": round(max(0, start - due) / 1e6, 3)})
+        return run
+
+    def profiled_after(ms, func=None, *a):
+        if func is None:
+            return after(ms)
+        return after(ms, timed(func, _now() + int(ms) * 1000000, "after"), *a)
+
+    def profiled_after_idle(func, *a):
+        return after_idle(timed(func, _now(), "idle"), *a)
+
+    root.after = profiled_after
+    root.after_idle = profiled_after_idle
+    root._profiled = True
+
+
+# output
+def trace_events():
+    pid = os.getpid()
+    events = []
+    for name, cat, start, dur, tid, args in list(_events):
+        event = {"name": name, "cat": cat, "ph": "X", "ts": (start - _T0) / 1000,
+                 "dur": dur / 1000, "pid": pid, "tid": tid}
+        if args:
+            event["args"] = args
+        events.append(event)
+    return events
+
+
+def export(path=None):
+    path = path or _path
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"traceEvents": trace_events(), "displayTimeUnit": "ms"}, f)
+    os.replace(tmp, path)
+    return path
+
+
+def summary():
+    # name -> count, total/mean/p95/max in ms, most expensive first
+    spans = {}
+    for name, _, _, dur, _, _ in list(_events):
+        spans.setdefault(name, []).append(dur / 1e6)
+    rows = []
+    for name, durs in spans.items():
+        durs.sort()
+        rows.append({
+            "name": name,
+            "count": len(durs),
+            "total_ms": sum(durs),
+            "mean_ms": sum(durs) / len(durs),
+            "p95_ms": durs[min(len(durs) - 1, int(len(durs) * 0.95))],
+            "max_ms": durs[-1],
+        })
+    rows.sort(key=lambda r: r["total_ms"], reverse=True)
+    return rows
+
+
+def print_summary(rows=None, limit=30):
+    rows = summary() if rows is None else rows
+    print(f"{'span':<40}{'count':>8}{'total':>11}{'mean':>10}{'p95':>10}{'max':>10}")
+    for r in rows[:limit]:
+        print(f"{r['name'][:39]:<40}{r['count']:>8}{r['total_ms']:>9.1f}ms"
+              f"{r['mean_ms']:>8.2f}ms{r['p95_ms']:>8.2f}ms{r['max_ms']:>8.2f}ms")
+
+
+def _on_exit():
+    if not _events:
+        return
+    try:
+        path = export()
+        print(f"profile: {len(_events)} spans written to {path}")
+        print_summary()
+    except OSError as e:
+        print(f"profile: could not write trace: {e}")
+
+
+_env = os.environ.get("WORDLE_PROFILE")
+if _env and _env != "0":
+    enable(None if _env == "1" else _env)
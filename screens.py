@@ -0,0 +1,41 @@
+# screen manager
+#
+# Each screen (menu, game) is built once per root window and then only
+# shown/hidden, instead of stacking a fresh MainMenu/WordleApp with all its
+# canvases, widgets, images and bindings on every switch. A screen is any
+# object with show() and hide(); factories are called as
+# factory(root, screens) the first time a screen is needed.
+
+from profiler import traced
+
+
+class ScreenManager:
+    def __init__(self, root):
+        self.root = root
+        self.factories = {}
+        self.screens = {}
+        self.current = None
+
+    def register(self, name, factory):
+        self.factories[name] = factory
+
+    def adopt(self, name, screen):
+        # a screen that was built directly rather than through the manager
+        self.screens[name] = screen
+        self.current = name
+
+    def get(self, name):
+        screen = self.screens.get(name)
+        if screen is None:
+            screen = self.factories[name](self.root, self)
+            self.screens[name] = screen
+        return screen
+
+    @traced("screen.switch")
+    def show(self, name):
+        if self.current is not None and self.current != name:
+            self.screens[self.current].hide()
+        screen = self.get(name)
+        self.current = name
+        screen.show()
+        return screen
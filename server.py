@@ -0,0 +1,378 @@
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import random
+import struct
+import sys
+import time
+from collections import OrderedDict
+
+import feedback
+import wordstore
+from wordle_engine import Wordle
+
+# game server
+#
+# Serves the Wordle engine to many players at once, stdlib only:
+#   python server.py --port 8765
+#
+# HTTP (JSON bodies, keep-alive):
+#   POST   /games               {"length": 5, "hard": false}  -> new game
+#   GET    /games/<id>                           -> game state
+#   POST   /games/<id>/guess    {"word": "..."}  -> feedback for the guess
+#   DELETE /games/<id>
+#   GET    /stats
+# WebSocket on /ws, one JSON message per request:
+#   {"op": "new", "length": 5, "hard": false}
+#   {"op": "guess", "id": ..., "word": ...}
+#   {"op": "state", "id": ...}
+#
+# Every session is a small Session holding its Wordle; word stores and
+# feedback tables are the shared per-process ones, so a session costs its
+# guesses plus one candidate bitset. Sessions live in an OrderedDict kept
+# in last-use order, so evicting idle ones (SESSION_TTL) or the oldest
+# when MAX_SESSIONS is reached only ever looks at the front.
+
+SESSION_TTL = 15 * 60
+MAX_SESSIONS = 100000
+READ_TIMEOUT = 30
+MAX_BODY = 16 * 1024
+SWEEP_INTERVAL = 5
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+class Session:
+    __slots__ = ("id", "wordle", "last_used")
+
+    def __init__(self, session_id, wordle):
+        self.id = session_id
+        self.wordle = wordle
+        self.last_used = time.monotonic()
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class GameServer:
+    def __init__(self, ttl=SESSION_TTL, max_sessions=MAX_SESSIONS, seed=None):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.sessions = OrderedDict()
+        self.rng = random.Random(seed)
+        self.counters = {"created": 0, "evicted": 0, "guesses": 0, "requests": 0}
+        self.started = time.monotonic()
+
+    # sessions
+    def create(self, length=wordstore.WORD_LENGTH, hard_mode=False):
+        # JSON values as sent, so "5", 5.7 or "false" are refused, not coerced
+        if not isinstance(length, int) or isinstance(length, bool):
+            raise ApiError(400, "length must be an integer")
+        if not isinstance(hard_mode, bool):
+            raise ApiError(400, "hard must be true or false")
+        try:
+            store = wordstore.get_store(length)
+        except ValueError as e:
+            raise ApiError(400, str(e))
+        while len(self.sessions) >= self.max_sessions:
+            self.sessions.popitem(last=False)
+            self.counters["evicted"] += 1
+        session_id = os.urandom(8).hex()
+        session = Session(session_id, Wordle(self.rng.choice(store.words), store, hard_mode))
+        self.sessions[session_id] = session
+        self.counters["created"] += 1
+        return session
+
+    def get(self, session_id):
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise ApiError(404, "no such game")
+        session.last_used = time.monotonic()
+        self.sessions.move_to_end(session_id)
+        return session
+
+    def delete(self, session_id):
+        if self.sessions.pop(session_id, None) is None:
+            raise ApiError(404, "no such game")
+
+    def evict_idle(self, now=None):
+        now = time.monotonic() if now is None else now
+        evicted = 0
+        while self.sessions:
+            session = next(iter(self.sessions.values()))
+            if now - session.last_used < self.ttl:
+                break
+            self.sessions.popitem(last=False)
+            evicted += 1
+        self.counters["evicted"] += evicted
+        return evicted
+
+    async def sweep(self):
+        while True:
+            await asyncio.sleep(min(SWEEP_INTERVAL, self.ttl))
+            self.evict_idle()
+
+    # game api
+    def state(self, session):
+        wordle = session.wordle
+        data = {
+            "id": session.id,
+            "length": wordle.WORD_LENGTH,
+            "hard": wordle.rules is not None,
+            "max_attempts": wordle.MAX_ATTEMPTS,
+            "guesses": [
+                {"word": word, "pattern": code}
+                for word, code in zip(wordle.attempts, wordle.patterns)
+            ],
+            "solved": wordle.is_solved,
+            "remaining": wordle.remaining_attempts,
+            "candidates": wordle.candidates.count,
+        }
+        if not wordle.can_attempt:
+            data["secret"] = wordle.secret
+        return data
+
+    def guess(self, session, word):
+        wordle = session.wordle
+        if not isinstance(word, str) or len(word) != wordle.WORD_LENGTH:
+            raise ApiError(400, f"guess must be {wordle.WORD_LENGTH} letters")
+        if not wordle.can_attempt:
+            raise ApiError(409, "game is over")
+        word = word.upper()
+        if word not in wordle.store:
+            raise ApiError(422, "not in word list")
+        rule = wordle.violation(word)
+        if rule:
+            raise ApiError(422, rule)
+        code = wordle.attempt(word)
+        self.counters["guesses"] += 1
+        data = self.state(session)
+        data["pattern"] = code
+        data["states"] = feedback.decode(code, wordle.WORD_LENGTH)
+        return data
+
+    def stats(self):
+        return dict(
+            self.counters,
+            sessions=len(self.sessions),
+            uptime=round(time.monotonic() - self.started, 1),
+        )
+
+    def dispatch(self, method, path, body):
+        # HTTP-style routing shared by both transports
+        self.counters["requests"] += 1
+        parts = [p for p in path.split("?", 1)[0].split("/") if p]
+        if parts == ["games"] and method == "POST":
+            return 201, self.state(self.create(body.get("length", wordstore.WORD_LENGTH), body.get("hard", False)))
+        if parts == ["stats"] and method == "GET":
+            return 200, self.stats()
+        if len(parts) >= 2 and parts[0] == "games":
+            if len(parts) == 2 and method == "GET":
+                return 200, self.state(self.get(parts[1]))
+            if len(parts) == 2 and method == "DELETE":
+                self.delete(parts[1])
+                return 200, {"deleted": parts[1]}
+            if len(parts) == 3 and parts[2] == "guess" and method == "POST":
+                return 200, self.guess(self.get(parts[1]), body.get("word"))
+        raise ApiError(404, "not found")
+
+    # transports
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(read_request(reader), READ_TIMEOUT)
+                except ApiError as e:
+                    # malformed or oversized request: answer, then hang up
+                    writer.write(http_response(e.status, {"error": str(e)}, False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                    await self.websocket(reader, writer, headers)
+                    break
+                try:
+                    payload = json.loads(body) if body else {}
+                    if not isinstance(payload, dict):
+                        raise ApiError(400, "body must be a JSON object")
+                    status, data = self.dispatch(method, path, payload)
+                except ValueError:
+                    status, data = 400, {"error": "invalid JSON"}
+                except ApiError as e:
+                    status, data = e.status, {"error": str(e)}
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(http_response(status, data, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def websocket(self, reader, writer, headers):
+        key = headers.get("sec-websocket-key", "")
+        accept = base64.b64encode(hashlib.sha1((key + _WS_GUID).encode()).digest()).decode()
+        writer.write((
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+        ).encode())
+        await writer.drain()
+        while True:
+            try:
+                opcode, payload = await asyncio.wait_for(read_frame(reader), self.ttl)
+            except ApiError:
+                # frame too large: close with 1009 (message too big)
+                writer.write(ws_frame(struct.pack("!H", 1009), 0x8))
+                await writer.drain()
+                break
+            if opcode == 0x8:
+                writer.write(ws_frame(b"", 0x8))
+                break
+            if opcode == 0x9:
+                writer.write(ws_frame(payload, 0xA))
+                continue
+            if opcode != 0x1:
+                continue
+            try:
+                message = json.loads(payload)
+                op = message.get("op")
+                if op == "new":
+                    status, data = self.dispatch("POST", "/games", message)
+                elif op == "guess":
+                    status, data = self.dispatch("POST", f"/games/{message.get('id')}/guess", message)
+                elif op == "state":
+                    status, data = self.dispatch("GET", f"/games/{message.get('id')}", message)
+                else:
+                    raise ApiError(400, f"unknown op: {op}")
+            except (ValueError, AttributeError):
+                status, data = 400, {"error": "invalid JSON"}
+            except ApiError as e:
+                status, data = e.status, {"error": str(e)}
+            data["status"] = status
+            writer.write(ws_frame(json.dumps(data).encode()))
+            await writer.drain()
+
+
+# HTTP / WebSocket wire format
+async def read_request(reader):
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, path, _ = line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise ApiError(400, "bad request line")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", 0) or 0)
+    except ValueError:
+        raise ApiError(400, "bad Content-Length")
+    if length < 0:
+        raise ApiError(400, "bad Content-Length")
+    if length > MAX_BODY:
+        raise ApiError(413, "body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), path, headers, body
+
+
+_REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+            409: "Conflict", 413: "Payload Too Large", 422: "Unprocessable Entity"}
+
+
+def http_response(status, data, keep_alive=True):
+    body = json.dumps(data).encode()
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode() + body
+
+
+async def read_frame(reader):
+    # one (unfragmented) client frame -> (opcode, payload)
+    first, second = await reader.readexactly(2)
+    opcode = first & 0x0F
+    length = second & 0x7F
+    if length == 126:
+        length = struct.unpack("!H", await reader.readexactly(2))[0]
+    elif length == 127:
+        length = struct.unpack("!Q", await reader.readexactly(8))[0]
+    if length > MAX_BODY:
+        raise ApiError(413, "frame too large")
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(b ^ mask[i & 3] for i, b in enumerate(payload))
+    return opcode, payload
+
+
+def ws_frame(payload, opcode=0x1, mask=None):
+    head = bytes([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    n = len(payload)
+    if n < 126:
+        head += bytes([mask_bit | n])
+    elif n < 1 << 16:
+        head += bytes([mask_bit | 126]) + struct.pack("!H", n)
+    else:
+        head += bytes([mask_bit | 127]) + struct.pack("!Q", n)
+    if mask:
+        payload = bytes(b ^ mask[i & 3] for i, b in enumerate(payload))
+        head += mask
+    return head + payload
+
+
+async def serve(host, port, server=None, ready=None):
+    server = server or GameServer()
+    # shared read-only data is loaded before the first player connects
+    wordstore.get_store()
+    feedback.get_table().matrix
+    listener = await asyncio.start_server(server.handle, host, port, backlog=1024)
+    sweeper = asyncio.create_task(server.sweep())
+    if ready is not None:
+        ready.set_result(listener.sockets[0].getsockname()[1])
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        sweeper.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve Wordle games over HTTP and WebSocket.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--ttl", type=float, default=SESSION_TTL, help="idle seconds before a game is dropped")
+    parser.add_argument("--max-sessions", type=int, default=MAX_SESSIONS)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.ttl, args.max_sessions, args.seed)
+    print(f"serving on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(serve(args.host, args.port, server))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
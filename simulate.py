@@ -0,0 +1,201 @@
+import argparse
+import importlib
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import feedback
+import wordstore
+from wordle_engine import Wordle
+
+# headless playouts
+#
+# Plays games with a guessing strategy and no UI, sharding the secrets
+# across a process pool. Every game is streamed to a JSONL file as its
+# shard finishes:
+#   python simulate.py --strategy entropy --out results.jsonl
+#
+# A strategy is a callable taking the Wordle being played and returning the
+# next guess. Built-in ones are listed in STRATEGIES, anything else can be
+# given as "module:function" where the function builds such a callable.
+# With --db the games also go into the SQLite history (see analytics.py).
+# Each result also carries how long the strategy took for every guess
+# (decision_ms); evaluate.py builds its report from those.
+
+
+def _solver_strategy(mode):
+    def build(seed=None):
+        import solver
+
+        def pick(wordle):
+            return solver.get_solver(mode, wordle.WORD_LENGTH).best_guess(wordle)
+        return pick
+    return build
+
+
+def _random_strategy(seed=None):
+    rng = random.Random(seed)
+
+    def pick(wordle):
+        return rng.choice(wordle.candidates.words)
+    return pick
+
+
+def _first_strategy(seed=None):
+    def pick(wordle):
+        return wordle.candidates.words[0]
+    return pick
+
+
+STRATEGIES = {
+    "entropy": _solver_strategy("entropy"),
+    "minimax": _solver_strategy("minimax"),
+    "expected": _solver_strategy("expected"),
+    "random": _random_strategy,
+    "first": _first_strategy,
+}
+
+
+def load_strategy(name, seed=None):
+    if name in STRATEGIES:
+        return STRATEGIES[name](seed)
+    module, _, attr = name.partition(":")
+    if not attr:
+        raise ValueError(f"unknown strategy: {name}")
+    return getattr(importlib.import_module(module), attr)(seed)
+
+
+def play(secret, strategy, store=None, hard_mode=False):
+    wordle = Wordle(secret, store, hard_mode)
+    decisions = []
+    while wordle.can_attempt:
+        start = time.perf_counter()
+        word = strategy(wordle)
+        decisions.append(round((time.perf_counter() - start) * 1000, 3))
+        if word is None:
+            break
+        wordle.attempt(word)
+    return {
+        "secret": wordle.secret,
+        "guesses": list(wordle.attempts),
+        "solved": wordle.is_solved,
+        "decision_ms": decisions,
+    }
+
+
+# worker side
+_worker = {}
+
+
+def _init_worker(strategy_name, seed, length, hard_mode=False):
+    _worker["store"] = wordstore.get_store(length)
+    _worker["hard_mode"] = hard_mode
+    _worker["strategy"] = strategy_name
+    _worker["seed"] = seed
+
+
+def _play_shard(index, secret_ids):
+    # every shard gets its own strategy seed so runs are reproducible
+    # whatever the number of workers
+    seed = _worker["seed"]
+    if seed is not None:
+        seed = seed * 1000003 + index + 1
+    store = _worker["store"]
+    strategy = load_strategy(_worker["strategy"], seed)
+    hard_mode = _worker["hard_mode"]
+    return [play(store.words[i], strategy, store, hard_mode) for i in secret_ids]
+
+
+def shard(ids, size):
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+
+def run(strategy_name="entropy", games=None, workers=None, out=None, seed=None, chunk_size=64,
+        db=None, length=wordstore.WORD_LENGTH, hard_mode=False, on_result=None):
+    store = wordstore.get_store(length)
+    # build the on-disk caches once here so workers only have to load them
+    table = feedback.get_table(length)
+    if table.dense:
+        table.matrix
+        if strategy_name in ("entropy", "minimax", "expected"):
+            import solver
+            solver.get_solver(strategy_name, length).warm()
+
+    ids = list(range(store.size))
+    if games is not None:
+        rng = random.Random(seed)
+        if games <= len(ids):
+            ids = rng.sample(ids, games)
+        else:
+            ids = [rng.choice(ids) for _ in range(games)]
+
+    workers = workers or os.cpu_count() or 1
+    summary = {"games": 0, "solved": 0, "guesses": 0}
+    sink = open(out, "w") if out else None
+    history = None
+    if db:
+        import analytics
+        history = analytics.HistoryDB(db)
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(strategy_name, seed, length, hard_mode)
+        ) as pool:
+            futures = [
+                pool.submit(_play_shard, index, part)
+                for index, part in enumerate(shard(ids, chunk_size))
+            ]
+            for future in as_completed(futures):
+                results = future.result()
+                if history:
+                    history.record_games(results, strategy_name)
+                for result in results:
+                    summary["games"] += 1
+                    summary["solved"] += result["solved"]
+                    summary["guesses"] += len(result["guesses"])
+                    if on_result:
+                        on_result(result)
+                    if sink:
+                        sink.write(json.dumps(result) + "\n")
+    finally:
+        if sink:
+            sink.close()
+        if history:
+            history.close()
+
+    elapsed = time.perf_counter() - start
+    summary["seconds"] = elapsed
+    summary["games_per_second"] = summary["games"] / elapsed if elapsed else 0.0
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play Wordle games headless.")
+    parser.add_argument("--strategy", default="entropy",
+                        help="built-in strategy (%s) or module:function" % ", ".join(STRATEGIES))
+    parser.add_argument("--games", type=int, default=None,
+                        help="number of games, default plays every word once")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--out", default=None, help="JSONL file for per-game results")
+    parser.add_argument("--db", default=None, help="also record games in this history database")
+    parser.add_argument("--length", type=int, default=wordstore.WORD_LENGTH, help="word length")
+    parser.add_argument("--hard", action="store_true", help="play in hard mode")
+    args = parser.parse_args(argv)
+
+    summary = run(args.strategy, args.games, args.workers, args.out, args.seed, args.chunk_size,
+                  args.db, args.length, args.hard)
+    games = summary["games"]
+    print(f"games: {games}  solved: {summary['solved']}  failed: {games - summary['solved']}")
+    if games:
+        print(f"mean guesses: {summary['guesses'] / games:.3f}")
+    print(f"time: {summary['seconds']:.2f}s  throughput: {summary['games_per_second']:.1f} games/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
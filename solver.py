@@ -0,0 +1,216 @@
+import json
+import math
+import os
+import threading
+from collections import Counter
+
+import feedback
+from feedback import partition
+
+# hint solver
+#
+# Ranks guesses by how well they split the remaining candidates, using the
+# rows of the feedback table. Three modes:
+#   entropy  - expected information gain in bits (default)
+#   minimax  - smallest worst-case bucket
+#   expected - lowest estimated number of guesses left
+# The opening ranking and the best second guesses are the costly part
+# (every guess against every secret), so they are cached on disk next to
+# the feedback table, keyed by the word-list hash.
+#
+# Lists too large for a full feedback matrix (see feedback.DENSE_LIMIT)
+# only consider the GUESS_POOL candidates with the most common letters as
+# guesses, since every row there has to be scored on demand.
+
+MODES = ("entropy", "minimax", "expected")
+OPENING_KEEP = 20
+GUESS_POOL = 200
+
+
+def _estimate(count):
+    # rough guesses-to-finish for a bucket of this size
+    if count <= 1:
+        return 1.0
+    return 1.0 + 0.56 * math.log2(count)
+
+
+class Solver:
+    def __init__(self, table=None, mode="entropy", cache_path=None):
+        if mode not in MODES:
+            raise ValueError(f"unknown solver mode: {mode}")
+        self.table = table or feedback.get_table()
+        self.store = self.table.store
+        self.mode = mode
+        self.solved = feedback.solved_code(self.store.length)
+        if cache_path is None:
+            suffix = "" if self.store.length == feedback.WORD_LENGTH else f"_{self.store.length}"
+            cache_path = os.path.join(feedback.CACHE_DIR, f"solver_{mode}{suffix}.json")
+        self.cache_path = cache_path
+        self._opening = None
+        self._second = {}
+        self._lock = threading.RLock()
+        self._nlogn = [0.0] + [c * math.log2(c) for c in range(1, self.store.size + 1)]
+        self._load_cache()
+
+    # scoring
+    def score(self, counts, total, is_candidate):
+        if self.mode == "entropy":
+            nlogn = self._nlogn
+            value = math.log2(total) - sum(nlogn[c] for c in counts.values()) / total
+        elif self.mode == "minimax":
+            value = -max(counts.values())
+        else:
+            expected = 0.0
+            for code, c in counts.items():
+                if code == self.solved:
+                    expected += c
+                else:
+                    expected += c * (1.0 + _estimate(c))
+            value = -expected / total
+        return (value, is_candidate)
+
+    def rank(self, candidate_ids=None, guess_ids=None, top=None):
+        # returns [(score, guess_id), ...] best first
+        table = self.table
+        if candidate_ids is None:
+            total = self.store.size
+            in_candidates = None
+        else:
+            total = len(candidate_ids)
+            in_candidates = set(candidate_ids)
+        if guess_ids is None:
+            guess_ids = self.guess_pool(candidate_ids)
+
+        ranked = []
+        for g in guess_ids:
+            counts = partition(table.row(g), candidate_ids)
+            is_candidate = in_candidates is None or g in in_candidates
+            ranked.append((self.score(counts, total, is_candidate), g))
+        ranked.sort(reverse=True)
+        return ranked[:top] if top else ranked
+
+    def guess_pool(self, candidate_ids=None):
+        if self.table.dense:
+            return range(self.store.size)
+        ids = range(self.store.size) if candidate_ids is None else candidate_ids
+        if len(ids) <= GUESS_POOL:
+            return ids
+        words = self.store.words
+        freq = Counter()
+        for i in ids:
+            freq.update(set(words[i]))
+        return sorted(ids, key=lambda i: -sum(freq[c] for c in set(words[i])))[:GUESS_POOL]
+
+    def best_id(self, candidate_ids, guess_ids=None):
+        if len(candidate_ids) <= 2:
+            return candidate_ids[0]
+        return self.rank(candidate_ids, guess_ids, top=1)[0][1]
+
+    # cached turns
+    # results are computed without holding the lock and only published
+    # under it, so a hint never waits for warm() to finish
+    def opening(self):
+        opening = self._opening
+        if opening is not None:
+            return opening
+        words = self.store.words
+        opening = [words[g] for _, g in self.rank(top=OPENING_KEEP)]
+        with self._lock:
+            if self._opening is None:
+                self._opening = opening
+                self._save_cache()
+            return self._opening
+
+    def second(self, opener, code, candidate_ids):
+        # only second guesses after one of the cached openers are kept,
+        # other openers would grow the cache file without bound
+        key = f"{opener}:{code}"
+        word = self._second.get(key)
+        if word is not None:
+            return word
+        word = self.store.words[self.best_id(candidate_ids)]
+        if opener not in (self._opening or ()):
+            return word
+        with self._lock:
+            if key in self._second:
+                return self._second[key]
+            self._second[key] = word
+            self._save_cache()
+        return word
+
+    def warm(self):
+        # fill the opening and every second guess after the best opener
+        opener = self.opening()[0]
+        row = self.table.row(self.store.id_of(opener))
+        buckets = {}
+        for s in range(self.store.size):
+            buckets.setdefault(row[s], []).append(s)
+        found = {}
+        for code, ids in buckets.items():
+            key = f"{opener}:{code}"
+            if code != self.solved and key not in self._second:
+                found[key] = self.store.words[self.best_id(ids)]
+        if found:
+            with self._lock:
+                for key, word in found.items():
+                    self._second.setdefault(key, word)
+                self._save_cache()
+
+    def best_guess(self, wordle):
+        candidates = wordle.candidates
+        if not candidates.count:
+            return None
+        if not wordle.attempts and candidates.count == self.store.size:
+            return self.opening()[0]
+        ids = candidates.ids
+        rules = getattr(wordle, "rules", None)
+        if rules is not None:
+            # hard mode: only guesses that keep the revealed hints, which
+            # the candidates always do (sparse tables stick to those)
+            guess_ids = rules.legal_ids(self.store) if self.table.dense else None
+            return self.store.words[self.best_id(ids, guess_ids)]
+        if len(wordle.attempts) == 1 and wordle.attempts[0] in self.store:
+            return self.second(wordle.attempts[0], wordle.patterns[0], ids)
+        return self.store.words[self.best_id(ids)]
+
+    # cache file
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("hash") != self.store.word_hash.hex() or data.get("mode") != self.mode:
+            return
+        self._opening = data.get("opening") or None
+        openers = set(self._opening or ())
+        self._second = {
+            key: word for key, word in data.get("second", {}).items()
+            if key.partition(":")[0] in openers
+        }
+
+    def _save_cache(self):
+        data = {
+            "hash": self.store.word_hash.hex(),
+            "mode": self.mode,
+            "opening": self._opening or [],
+            "second": dict(self._second),
+        }
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+
+
+_solvers = {}
+
+
+def get_solver(mode="entropy", length=feedback.WORD_LENGTH):
+    key = (mode, length)
+    if key not in _solvers:
+        _solvers[key] = Solver(feedback.get_table(length), mode=mode)
+    return _solvers[key]
@@ -1,8 +1,29 @@
-import pygame
 import os
+import queue
+import threading
+import time
+
+from profiler import traced
+
+# pygame is imported by the first SoundManager, importing it and opening
+# the mixer is one of the slower parts of startup
+pygame = None
+
+
+def _import_pygame():
+    global pygame
+    if pygame is None:
+        import pygame as module
+        pygame = module
+    return pygame
 
 class SoundManager:
+    # music fades out/in over this many ms when switching tracks
+    FADE_MS = 400
+
+    @traced("sound.init")
     def __init__(self):
+        _import_pygame()
         pygame.mixer.init()
 
         # --- Background Musics ---
@@ -22,12 +43,17 @@ class SoundManager:
 
         self.sound_enabled = True
 
+        # music is loaded on a worker thread so the Tk loop never waits on
+        # decoding a multi-MB mp3
+        self.current_music = None
+        self._requests = queue.Queue()
+        self._worker = threading.Thread(target=self._music_loop, daemon=True)
+        self._worker.start()
+
     def play_music(self, file, loop=True):
         if not self.sound_enabled:
             return
-        pygame.mixer.music.load(file)
-        pygame.mixer.music.set_volume(self.music_volume)
-        pygame.mixer.music.play(-1 if loop else 0)
+        self._requests.put(("play", file, loop))
 
     def play_menu_music(self):
         self.play_music(self.menu_music)
@@ -36,9 +62,36 @@ class SoundManager:
         self.play_music(self.game_music)
 
     def stop_music(self):
-        pygame.mixer.music.stop()
+        self._requests.put(("stop", None, False))
+
+    def _music_loop(self):
+        while True:
+            request = self._requests.get()
+            # only the newest request matters, e.g. stop+play on a screen switch
+            while not self._requests.empty():
+                request = self._requests.get_nowait()
+            action, file, loop = request
+            try:
+                if action == "stop":
+                    if pygame.mixer.music.get_busy():
+                        pygame.mixer.music.fadeout(self.FADE_MS)
+                    self.current_music = None
+                    continue
+                if file == self.current_music and pygame.mixer.music.get_busy():
+                    continue
+                if pygame.mixer.music.get_busy():
+                    pygame.mixer.music.fadeout(self.FADE_MS)
+                    time.sleep(self.FADE_MS / 1000)
+                    if not self._requests.empty():
+                        continue
+                pygame.mixer.music.load(file)
+                pygame.mixer.music.set_volume(self.music_volume if self.sound_enabled else 0)
+                pygame.mixer.music.play(-1 if loop else 0, fade_ms=self.FADE_MS)
+                self.current_music = file
+            except pygame.error:
+                self.current_music = None
+
 
-  
     def play(self, name):
         if self.sound_enabled and name in self.sfx:
             self.sfx[name].play()
@@ -53,3 +106,70 @@ class SoundManager:
             pygame.mixer.music.set_volume(self.music_volume)
             for s in self.sfx.values():
                 s.set_volume(self.sfx_volume)
+
+
+_manager = None
+_manager_lock = threading.Lock()
+_pending_lock = threading.Lock()
+_pending = {}
+_preloading = False
+
+
+def get_sound_manager():
+    # one mixer and one set of decoded SFX per process
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            manager = SoundManager()
+            # replay and publish together, so a call made meanwhile through
+            # DeferredSound waits here instead of running before the replay
+            with _pending_lock:
+                request = _pending.pop("music", None)
+                if request is not None:
+                    getattr(manager, request[0])(*request[1])
+                _manager = manager
+    return _manager
+
+
+def preload_sound_manager(on_ready=None):
+    # build the manager on a worker thread, get_sound() calls made before
+    # it is ready are handled by DeferredSound
+    global _preloading
+    if _preloading:
+        return
+    _preloading = True
+
+    def load():
+        try:
+            get_sound_manager()
+        except Exception as e:
+            # no audio: DeferredSound keeps dropping calls
+            print(f"sound: disabled ({e})")
+            return
+        if on_ready is not None:
+            on_ready()
+    threading.Thread(target=load, daemon=True).start()
+
+
+class DeferredSound:
+    # stands in for the SoundManager while it loads; the latest music
+    # request is replayed once it is there, effects are dropped until then
+    def __getattr__(self, name):
+        def call(*args):
+            manager = _manager
+            if manager is None:
+                with _pending_lock:
+                    manager = _manager
+                    if manager is None:
+                        if name.startswith(("play_", "stop_")):
+                            _pending["music"] = (name, args)
+                        return None
+            return getattr(manager, name)(*args)
+        return call
+
+
+_deferred = DeferredSound()
+
+
+def get_sound():
+    return _deferred
@@ -0,0 +1,260 @@
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+
+# game statistics
+#
+# Every finished game is appended as one JSON line to an event log
+# (secret, guesses, guess count, duration, result). The UI only ever reads
+# the in-memory aggregate (wins/losses, streaks, guess distribution).
+#
+# Disk writes happen on a background thread: queued events are appended in
+# batches, and every COMPACT_EVERY events the aggregate is written to a
+# snapshot with an atomic rename. The snapshot remembers the last event
+# sequence number and the log offset it covers, so startup loads the
+# snapshot and only replays the tail of the log. A torn last line from a
+# crash is skipped. The log itself is kept as the per-game history.
+#
+# When WORDLE_HISTORY_DB names a database file, the writer thread also
+# records every game there (see analytics.py).
+#
+# wordle_stats.json is the old wins/losses file. It is only read, as the
+# starting snapshot, until the first snapshot of our own has been written.
+
+SNAPSHOT_FILE = "wordle_stats_snapshot.json"
+LEGACY_FILE = "wordle_stats.json"
+LOG_FILE = "wordle_events.jsonl"
+COMPACT_EVERY = 20
+MAX_GUESSES = 6
+
+
+class StatsAggregate:
+    def __init__(self):
+        self.wins = 0
+        self.losses = 0
+        self.current_streak = 0
+        self.max_streak = 0
+        self.distribution = [0] * (MAX_GUESSES + 1)  # index = guesses on a win
+        self.last_seq = 0
+
+    @property
+    def games(self):
+        return self.wins + self.losses
+
+    @property
+    def win_rate(self):
+        return self.wins / self.games * 100 if self.games else 0.0
+
+    def apply(self, event):
+        if event["won"]:
+            self.wins += 1
+            self.current_streak += 1
+            self.max_streak = max(self.max_streak, self.current_streak)
+            count = event["guess_count"]
+            if count >= len(self.distribution):
+                self.distribution.extend([0] * (count + 1 - len(self.distribution)))
+            self.distribution[count] += 1
+        else:
+            self.losses += 1
+            self.current_streak = 0
+        self.last_seq = event["seq"]
+
+    def to_dict(self):
+        return {
+            "wins": self.wins,
+            "losses": self.losses,
+            "current_streak": self.current_streak,
+            "max_streak": self.max_streak,
+            "distribution": self.distribution,
+            "last_seq": self.last_seq,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        agg = cls()
+        # older files only have wins/losses
+        agg.wins = int(data.get("wins", 0))
+        agg.losses = int(data.get("losses", 0))
+        agg.current_streak = int(data.get("current_streak", 0))
+        agg.max_streak = int(data.get("max_streak", 0))
+        agg.distribution = list(data.get("distribution", agg.distribution))
+        agg.last_seq = int(data.get("last_seq", 0))
+        return agg
+
+
+def _read_snapshot(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    # old files can still hold merge conflict markers around two versions,
+    # keep the one that has seen the most games
+    versions = []
+    for line in text.splitlines():
+        try:
+            data = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            versions.append(data)
+    if not versions:
+        raise ValueError("no stats found")
+    return max(versions, key=lambda d: int(d.get("wins", 0)) + int(d.get("losses", 0)))
+
+
+class StatsStore:
+    def __init__(self, snapshot_path=SNAPSHOT_FILE, log_path=LOG_FILE, history_path=None,
+                 legacy_path=LEGACY_FILE):
+        self.snapshot_path = snapshot_path
+        self.legacy_path = legacy_path
+        self.log_path = log_path
+        self.history_path = history_path
+        self._history = None
+        self.aggregate, self._log_offset = self._load()
+        self._seq = self.aggregate.last_seq
+        # writer-side copy that only includes events already in the log
+        self._on_disk = StatsAggregate.from_dict(self.aggregate.to_dict())
+        self._pending = 0
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    # loading
+    def _load(self):
+        agg = StatsAggregate()
+        offset = 0
+        path = self.snapshot_path
+        if self.legacy_path and not os.path.exists(path):
+            path = self.legacy_path
+        try:
+            with open(path, "r") as f:
+                data = _read_snapshot(f.read())
+            agg = StatsAggregate.from_dict(data)
+            offset = int(data.get("log_offset", 0))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"stats: ignoring unreadable snapshot {path}: {e}")
+
+        try:
+            size = os.path.getsize(self.log_path)
+        except OSError:
+            return agg, 0
+        if offset > size:
+            # log was replaced since the snapshot, fall back to sequence numbers
+            offset = 0
+        torn = False
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    torn = True
+                    break
+                offset += len(line)
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if event.get("seq", 0) > agg.last_seq:
+                    agg.apply(event)
+        if torn:
+            # drop a half-written last event so new ones start on a clean line
+            os.truncate(self.log_path, offset)
+        return agg, offset
+
+    # recording
+    def record_game(self, secret, guesses, won, duration):
+        self._seq += 1
+        event = {
+            "seq": self._seq,
+            "time": time.time(),
+            "secret": secret,
+            "guesses": list(guesses),
+            "guess_count": len(guesses),
+            "won": bool(won),
+            "duration": round(duration, 3),
+        }
+        self.aggregate.apply(event)
+        self._queue.put(event)
+        return event
+
+    def flush(self):
+        # block until everything queued so far is on disk
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self):
+        done = threading.Event()
+        self._queue.put(("compact", done))
+        done.wait(timeout=5)
+
+    # writer thread
+    def _write_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            events = [item for item in batch if isinstance(item, dict)]
+            try:
+                if events:
+                    self._append(events)
+                    if self.history_path:
+                        self._record_history(events)
+                if self._pending >= COMPACT_EVERY or any(isinstance(i, tuple) for i in batch):
+                    self._compact()
+            except OSError as e:
+                print(f"stats: write failed: {e}")
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif isinstance(item, tuple):
+                    item[1].set()
+
+    def _append(self, events):
+        data = "".join(json.dumps(e) + "\n" for e in events).encode("utf-8")
+        with open(self.log_path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            self._log_offset = f.tell()
+        for event in events:
+            self._on_disk.apply(event)
+        self._pending += len(events)
+
+    def _record_history(self, events):
+        # sqlite connections stay on the thread that opened them
+        try:
+            if self._history is None:
+                import analytics
+                self._history = analytics.HistoryDB(self.history_path)
+            self._history.record_games(events)
+        except Exception as e:
+            print(f"stats: history database write failed: {e}")
+
+    def _compact(self):
+        if not self._pending:
+            return
+        snapshot = self._on_disk.to_dict()
+        snapshot["log_offset"] = self._log_offset
+        tmp = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(snapshot, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snapshot_path)
+        self._pending = 0
+
+
+_store = None
+
+
+def get_stats_store():
+    global _store
+    if _store is None:
+        _store = StatsStore(history_path=os.environ.get("WORDLE_HISTORY_DB") or None)
+        atexit.register(_store.close)
+    return _store
@@ -0,0 +1,79 @@
+import time
+
+from assets import ImageCache
+
+# image cache bookkeeping, with a stand-in for PhotoImage so no display
+# is needed
+
+
+class FakeImage:
+    def __init__(self, path, size):
+        self.path = path
+        self.size = size or (10, 10)
+
+    def width(self):
+        return self.size[0]
+
+    def height(self):
+        return self.size[1]
+
+
+def _cache(max_bytes):
+    cache = ImageCache(max_bytes)
+    loads = []
+
+    def load(path, size, master):
+        loads.append((path, size))
+        return FakeImage(path, size)
+    cache._load = load
+    return cache, loads
+
+
+def test_hits_return_the_same_image():
+    cache, loads = _cache(1 << 20)
+    first = cache.get("a.png", (10, 10))
+    assert cache.get("a.png", [10, 10]) is first
+    assert cache.get("a.png", (20, 10)) is not first
+    assert loads == [("a.png", (10, 10)), ("a.png", (20, 10))]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_least_recently_used_is_evicted():
+    # room for two 10x10 images (400 bytes each)
+    cache, loads = _cache(800)
+    cache.get("a.png", (10, 10))
+    cache.get("b.png", (10, 10))
+    cache.get("a.png", (10, 10))  # b is now the oldest
+    cache.get("c.png", (10, 10))
+    assert len(cache) == 2 and cache.used == 800
+    cache.get("a.png", (10, 10))
+    cache.get("b.png", (10, 10))
+    assert loads.count(("b.png", (10, 10))) == 2
+    assert loads.count(("a.png", (10, 10))) == 1
+
+
+def test_oversized_image_is_still_kept():
+    cache, _ = _cache(100)
+    image = cache.get("big.png", (100, 100))
+    assert len(cache) == 1
+    assert cache.get("big.png", (100, 100)) is image
+
+
+def test_failed_prefetch_is_reported(tmp_path):
+    cache = ImageCache()
+    path = str(tmp_path / "missing.png")
+    cache.prefetch(path, (10, 10))
+    for _ in range(200):
+        if cache.failed(path, (10, 10)) or cache.ready(path, (10, 10)):
+            break
+        time.sleep(0.01)
+    assert not cache.ready(path, (10, 10))
+    assert isinstance(cache.failed(path, (10, 10)), FileNotFoundError)
+
+
+def test_prepared_copy_dropped_after_direct_load():
+    cache, _ = _cache(1 << 20)
+    key = ("a.png", (10, 10))
+    cache._prepared[key] = ("file", "a.png")  # a prefetch finishing late
+    cache.get(*key)
+    assert key not in cache._prepared
@@ -0,0 +1,84 @@
+import random
+
+import feedback
+from candidates import CandidateTracker, HardModeRules, constraint_mask
+
+# candidate narrowing against a filter that rescores every word, and
+# hard mode rules against checking every earlier guess by hand
+
+
+def test_constraint_mask_matches_filter(store):
+    words = store.words
+    rng = random.Random(3)
+    for _ in range(60):
+        guess = rng.choice(words)
+        code = feedback.score(guess, rng.choice(words))
+        expected = [w for w in words if feedback.score(guess, w) == code]
+        assert store.words_in(constraint_mask(store, guess, code)) == expected
+
+
+def test_tracker_follows_a_game(store):
+    rng = random.Random(5)
+    for _ in range(10):
+        secret = rng.choice(store.words)
+        tracker = CandidateTracker(store)
+        remaining = list(store.words)
+        for _ in range(4):
+            guess = rng.choice(store.words)
+            code = feedback.score(guess, secret)
+            tracker.apply(guess, code)
+            remaining = [w for w in remaining if feedback.score(guess, w) == code]
+            assert tracker.words == remaining
+            assert len(tracker) == len(remaining)
+            assert secret in tracker
+
+
+def _legal(word, guesses):
+    # greens stay put, greens + yellows stay in the guess
+    for guess, code in guesses:
+        need = {}
+        for p, (c, state) in enumerate(zip(guess, feedback.decode(code, len(guess)))):
+            if state == feedback.GREEN and word[p] != c:
+                return False
+            if state != feedback.GRAY:
+                need[c] = need.get(c, 0) + 1
+        if any(word.count(c) < n for c, n in need.items()):
+            return False
+    return True
+
+
+def test_hard_mode_rules_match_filter(store):
+    words = store.words
+    rng = random.Random(4)
+    for _ in range(30):
+        secret = rng.choice(words)
+        rules = HardModeRules(store.length)
+        guesses = []
+        for _ in range(3):
+            guess = rng.choice(rules.legal_words(store))
+            code = feedback.score(guess, secret)
+            rules.update(guess, code)
+            guesses.append((guess, code))
+
+            legal = [w for w in words if _legal(w, guesses)]
+            assert rules.legal_words(store) == legal
+            assert [w for w in words if rules.check(w) is None] == legal
+            # a partial guess is only flagged once no completion is legal
+            for w in rng.sample(words, 20):
+                for k in range(store.length):
+                    if rules.check_prefix(w[:k]) is not None:
+                        assert not any(x.startswith(w[:k]) for x in legal)
+            for w in legal:
+                for k in range(store.length):
+                    assert rules.check_prefix(w[:k]) is None
+
+
+def test_hard_mode_messages():
+    from wordle_engine import Wordle
+    wordle = Wordle("CRANE", hard_mode=True)
+    wordle.attempt("TRACE")
+    assert wordle.violation("S") is None
+    assert wordle.violation("SLATE") == "2nd letter must be R"
+    assert wordle.violation("SRAN") == "Guess must contain C"
+    assert wordle.violation("BRACE") is None
+    assert "CRANE" in wordle.legal_words()
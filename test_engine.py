@@ -0,0 +1,100 @@
+import random
+
+import feedback
+import wordstore
+from wordle_engine import AbsurdleWordle, MultiWordle, Wordle
+
+# game modes built on the shared table: multi-board play against one
+# Wordle per secret, Absurdle against a partition done by rescoring
+
+
+def _secrets(count, seed):
+    return random.Random(seed).sample(wordstore.get_store().words, count)
+
+
+def test_multi_boards_match_single_games():
+    store = wordstore.get_store()
+    rng = random.Random(7)
+    for seed in range(5):
+        secrets = _secrets(4, seed)
+        game = MultiWordle(secrets)
+        singles = [Wordle(s) for s in secrets]
+        for _ in range(3):
+            guess = rng.choice(store.words)
+            codes = game.attempt(guess)
+            for i, single in enumerate(singles):
+                if single.is_solved:
+                    continue
+                assert codes[i] == single.attempt(guess)
+                assert game.boards[i].candidates.words == single.candidates.words
+
+
+def test_multi_solved_boards_sit_out():
+    secrets = _secrets(2, 11)
+    game = MultiWordle(secrets)
+    codes = game.attempt(secrets[0])
+    assert codes[0] == feedback.solved_code(game.WORD_LENGTH)
+    assert game.active == [1] and game.solved_count == 1
+    codes = game.attempt(secrets[0])
+    assert codes[0] is None and codes[1] is not None
+    game.attempt(secrets[1])
+    assert game.is_solved and not game.can_attempt
+    assert game.secret == ", ".join(secrets)
+
+
+def test_multi_runs_out_of_attempts():
+    secrets = _secrets(4, 12)
+    game = MultiWordle(secrets)
+    assert game.MAX_ATTEMPTS == 4 + MultiWordle.EXTRA_ATTEMPTS
+    assert all(board.MAX_ATTEMPTS == game.MAX_ATTEMPTS for board in game.boards)
+    miss = next(w for w in wordstore.get_store().words if w not in secrets)
+    for _ in range(game.MAX_ATTEMPTS):
+        assert game.can_attempt
+        game.attempt(miss)
+    assert not game.can_attempt and game.remaining_attempts == 0
+    assert game.solved_count == 0
+
+
+def _naive_buckets(guess, candidates):
+    buckets = {}
+    for word in candidates:
+        code = feedback.score(guess, word)
+        buckets.setdefault(code, []).append(word)
+    return buckets
+
+
+def test_absurdle_keeps_the_largest_bucket():
+    store = wordstore.get_store()
+    rng = random.Random(21)
+    for _ in range(3):
+        game = AbsurdleWordle()
+        remaining = list(store.words)
+        while game.can_attempt and len(remaining) > 1:
+            guess = rng.choice(store.words)
+            buckets = _naive_buckets(guess, remaining)
+            largest = max(len(words) for words in buckets.values())
+            code = game.attempt(guess)
+            assert len(buckets[code]) == largest
+            # ties go to the fewest greens
+            greens = feedback.decode(code, game.WORD_LENGTH).count(feedback.GREEN)
+            for other, words in buckets.items():
+                if len(words) == largest:
+                    assert greens <= feedback.decode(other, game.WORD_LENGTH).count(feedback.GREEN)
+            remaining = buckets[code]
+            assert game.candidates.words == remaining
+
+
+def test_absurdle_is_solved_only_on_the_last_word():
+    game = AbsurdleWordle()
+    first = game.store.words[0]
+    assert not game.is_solved and game.secret in game.candidates.words
+    game.attempt(first)
+    assert not game.is_solved  # a guess never wins while others are left
+    while game.candidates.count > 1 and game.can_attempt:
+        game.attempt(game.candidates.words[0])
+    assert game.candidates.count == 1
+    last = game.candidates.words[0]
+    assert not game.is_solved and game.secret == last
+    game.attempt(last)
+    assert game.is_solved and game.secret == last
+    assert not game.can_attempt
@@ -0,0 +1,46 @@
+import random
+
+import feedback
+from wordstore import WordStore
+
+# the bitset row scorer and the cached matrix against feedback.score
+
+
+def test_row_scorer_matches_score(store):
+    words = store.words
+    with_store = feedback.RowScorer(words, store.length, store)
+    without = feedback.RowScorer(words, store.length)
+    for guess in random.Random(2).sample(words, 40):
+        expected = [feedback.score(guess, s) for s in words]
+        assert list(with_store.row(guess)) == expected
+        assert list(without.row(guess)) == expected
+
+
+def test_decode_encode_round_trip():
+    for length in (5, 6):
+        for code in range(0, 3 ** length, 7):
+            assert feedback.encode(feedback.decode(code, length)) == code
+
+
+def test_cache_header_matches_word_list(store, tmp_path):
+    path = str(tmp_path / "feedback.bin")
+    table = feedback.FeedbackTable(store, cache_path=path)
+    assert list(table.row(7)) == [feedback.score(store.words[7], s) for s in store.words]
+
+    # same list: loaded from the file as is
+    assert feedback.FeedbackTable(store, cache_path=path)._load() is not None
+    # a list of the same size with one word changed must not reuse it
+    words = list(store.words)
+    words[0] = "Q" * store.length
+    other = feedback.FeedbackTable(WordStore(words, store.length), cache_path=path)
+    assert other._load() is None
+    assert list(other.row(0)) == [feedback.score(words[0], s) for s in words]
+
+
+def test_sparse_rows_match_dense(store, monkeypatch):
+    dense = feedback.FeedbackTable(store)
+    monkeypatch.setattr(feedback, "DENSE_LIMIT", 0)
+    sparse = feedback.FeedbackTable(store)
+    assert not sparse.dense
+    for g in (0, 5, store.size - 1):
+        assert list(sparse.row(g)) == list(dense.row(g))
@@ -0,0 +1,97 @@
+import asyncio
+import json
+
+import pytest
+
+import server
+from server import ApiError, GameServer
+
+# game server: request validation through dispatch and on the wire
+
+
+def _new(game_server, **body):
+    return game_server.dispatch("POST", "/games", body)
+
+
+def test_create_validates_json_types():
+    game_server = GameServer(seed=1)
+    for body in ({"length": "5"}, {"length": 5.7}, {"length": True}, {"hard": "false"}, {"hard": 1}):
+        with pytest.raises(ApiError) as e:
+            _new(game_server, **body)
+        assert e.value.status == 400
+    with pytest.raises(ApiError) as e:
+        _new(game_server, length=9)
+    assert e.value.status == 400
+    status, game = _new(game_server, hard=False)
+    assert status == 201 and game["hard"] is False and game["length"] == 5
+
+
+def test_guess_errors_and_hard_mode():
+    game_server = GameServer(seed=1)
+    _, game = _new(game_server, hard=True)
+    session = game_server.get(game["id"])
+    session.wordle.secret = "CRANE"
+    guess = f"/games/{game['id']}/guess"
+
+    with pytest.raises(ApiError) as e:
+        game_server.dispatch("POST", guess, {"word": "ABC"})
+    assert e.value.status == 400
+    with pytest.raises(ApiError) as e:
+        game_server.dispatch("POST", guess, {"word": "QQQQQ"})
+    assert e.value.status == 422
+    _, state = game_server.dispatch("POST", guess, {"word": "trace"})
+    assert list(state["states"]) == [0, 2, 2, 1, 2]
+    with pytest.raises(ApiError) as e:
+        game_server.dispatch("POST", guess, {"word": "SLATE"})
+    assert (e.value.status, str(e.value)) == (422, "2nd letter must be R")
+    _, state = game_server.dispatch("POST", guess, {"word": "crane"})
+    assert state["solved"] and state["secret"] == "CRANE"
+    with pytest.raises(ApiError) as e:
+        game_server.dispatch("POST", guess, {"word": "CRANE"})
+    assert e.value.status == 409
+    with pytest.raises(ApiError) as e:
+        game_server.dispatch("GET", "/games/nope", {})
+    assert e.value.status == 404
+
+
+def test_max_sessions_evicts_oldest():
+    game_server = GameServer(max_sessions=2, seed=1)
+    first = _new(game_server)[1]["id"]
+    _new(game_server)
+    _new(game_server)
+    assert first not in game_server.sessions
+    assert game_server.counters["evicted"] == 1
+
+
+async def _exchange(port, data):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+@pytest.mark.parametrize("request_bytes, status", [
+    (b"POST /games HTTP/1.1\r\nContent-Length: -5\r\n\r\n", 400),
+    (b"POST /games HTTP/1.1\r\nContent-Length: x\r\n\r\n", 400),
+    (b"POST /games HTTP/1.1\r\nContent-Length: 99999\r\n\r\n", 413),
+    (b"GARBAGE\r\n\r\n", 400),
+    (b"POST /games HTTP/1.1\r\nConnection: close\r\nContent-Length: 3\r\n\r\n{x}", 400),
+    (b"POST /games HTTP/1.1\r\nConnection: close\r\nContent-Length: 2\r\n\r\n[]", 400),
+    (b"GET /nowhere HTTP/1.1\r\nConnection: close\r\n\r\n", 404),
+])
+def test_bad_requests_get_an_answer(request_bytes, status):
+    async def run():
+        ready = asyncio.get_running_loop().create_future()
+        task = asyncio.create_task(server.serve("127.0.0.1", 0, GameServer(seed=1), ready))
+        try:
+            port = await ready
+            return await asyncio.wait_for(_exchange(port, request_bytes), 5)
+        finally:
+            task.cancel()
+
+    got, body = asyncio.run(run())
+    assert got == status
+    assert "error" in body
@@ -0,0 +1,68 @@
+import feedback
+import solver
+from candidates import CandidateTracker
+from wordstore import WordStore
+
+# solver ranking and its on-disk cache
+
+
+def _solver(store, path, mode="entropy"):
+    return solver.Solver(feedback.FeedbackTable(store), mode=mode, cache_path=str(path))
+
+
+def test_rank_matches_bucket_sizes(store, tmp_path):
+    s = _solver(store, tmp_path / "s.json", "minimax")
+    ids = list(range(0, store.size, 3))
+    worst = {}
+    for g in range(store.size):
+        buckets = {}
+        for i in ids:
+            code = feedback.score(store.words[g], store.words[i])
+            buckets[code] = buckets.get(code, 0) + 1
+        worst[g] = max(buckets.values())
+    best = s.best_id(ids)
+    assert worst[best] == min(worst.values())
+
+
+def test_opening_is_cached_on_disk(store, tmp_path, monkeypatch):
+    path = tmp_path / "s.json"
+    opening = _solver(store, path).opening()
+    assert len(opening) == solver.OPENING_KEEP
+
+    def no_rank(*args, **kwargs):
+        raise AssertionError("opening should come from the cache")
+    monkeypatch.setattr(solver.Solver, "rank", no_rank)
+    assert _solver(store, path).opening() == opening
+    monkeypatch.undo()
+
+    # another word list does not use it
+    words = list(store.words)
+    words[0] = "Q" * store.length
+    assert _solver(WordStore(words, store.length), path)._opening is None
+
+
+def test_second_guess_cache(store, tmp_path, monkeypatch):
+    path = tmp_path / "s.json"
+    s = _solver(store, path)
+    opener = s.opening()[0]
+    saves = []
+    save = s._save_cache
+    monkeypatch.setattr(s, "_save_cache", lambda: saves.append(1) or save())
+
+    def play(word):
+        tracker = CandidateTracker(store)
+        code = feedback.score(word, store.words[1])
+        tracker.apply(word, code)
+        return s.second(word, code, tracker.ids), f"{word}:{code}"
+
+    word, key = play(opener)
+    assert s._second[key] == word
+    assert play(opener)[0] == word
+    assert len(saves) == 1
+
+    # a word outside the cached openings is answered but not stored
+    other = next(w for w in store.words if w not in s.opening())
+    play(other)
+    assert not any(k.startswith(other + ":") for k in s._second)
+    assert len(saves) == 1
+    assert _solver(store, path)._second == s._second
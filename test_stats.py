@@ -0,0 +1,72 @@
+import json
+import os
+
+from stats import StatsStore
+
+# stats persistence: log replay from the snapshot offset, torn last
+# lines, and the old wordle_stats.json as a starting point
+
+
+def _store(tmp_path, legacy=None):
+    return StatsStore(
+        snapshot_path=str(tmp_path / "snapshot.json"),
+        log_path=str(tmp_path / "events.jsonl"),
+        legacy_path=str(tmp_path / "legacy.json") if legacy is None else legacy,
+    )
+
+
+def _play(store, won=True, guesses=("CRANE", "SLATE")):
+    store.record_game("SLATE", list(guesses), won, 1.0)
+
+
+def test_replay_from_snapshot_offset(tmp_path):
+    store = _store(tmp_path)
+    for _ in range(3):
+        _play(store)
+    store.close()  # compacts: snapshot covers the log so far
+    snapshot = json.loads((tmp_path / "snapshot.json").read_text())
+    assert snapshot["wins"] == 3
+    assert snapshot["log_offset"] == os.path.getsize(tmp_path / "events.jsonl")
+
+    _play(store, won=False)
+    store.flush()  # logged, not compacted
+    reloaded = _store(tmp_path)
+    agg = reloaded.aggregate
+    assert (agg.wins, agg.losses, agg.current_streak, agg.max_streak) == (3, 1, 0, 3)
+    assert agg.distribution[2] == 3
+
+
+def test_torn_last_line_is_dropped(tmp_path):
+    store = _store(tmp_path)
+    _play(store)
+    _play(store)
+    store.flush()
+    log = tmp_path / "events.jsonl"
+    size = os.path.getsize(log)
+    with open(log, "ab") as f:
+        f.write(b'{"seq": 3, "won": tr')
+
+    reloaded = _store(tmp_path)
+    assert reloaded.aggregate.wins == 2
+    assert os.path.getsize(log) == size
+    _play(reloaded)
+    reloaded.flush()
+    lines = log.read_bytes().splitlines()
+    assert [json.loads(line)["seq"] for line in lines] == [1, 2, 3]
+
+
+def test_legacy_file_with_conflict_markers(tmp_path):
+    legacy = tmp_path / "legacy.json"
+    legacy.write_text(
+        '<<<<<<< HEAD\n{"wins": 12, "losses": 1}\n=======\n'
+        '{"wins": 0, "losses": 0}\n>>>>>>> b32bfea\n'
+    )
+    store = _store(tmp_path)
+    assert (store.aggregate.wins, store.aggregate.losses) == (12, 1)
+
+    _play(store)
+    store.close()
+    # the new snapshot takes over, the old file is left alone
+    assert json.loads((tmp_path / "snapshot.json").read_text())["wins"] == 13
+    assert legacy.read_text().startswith("<<<<<<<")
+    assert _store(tmp_path).aggregate.wins == 13
@@ -0,0 +1,38 @@
+import wordstore
+from wordstore import WordStore, bitset, iter_ids
+
+# word store lookups and bitsets
+
+
+def test_iter_ids_round_trip():
+    ids = [0, 1, 7, 8, 63, 64, 200]
+    assert list(iter_ids(bitset(ids, 256))) == ids
+    assert list(iter_ids(0)) == []
+
+
+def test_masks_match_words(store):
+    words = store.words
+    for p in range(store.length):
+        for c in "AEILNRST":
+            expected = [w for w in words if w[p] == c]
+            assert store.words_in(store.position_mask(p, c)) == expected
+    for c in "AEILNRST":
+        for n in range(store.length + 1):
+            expected = [w for w in words if w.count(c) >= n]
+            assert store.words_in(store.count_mask(c, n)) == expected
+
+
+def test_membership_and_ids(store):
+    word = store.words[3]
+    assert word in store
+    assert store.id_of(word) == 3
+    assert "Z" * store.length not in store
+    assert store.id_of("Z" * store.length) is None
+
+
+def test_load_words_keeps_plain_words(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("éclair\nstraße\nplanet\nPLANET\nab-cde\ncastle\n", encoding="utf-8")
+    assert wordstore.load_words(str(path), 6) == ["PLANET", "CASTLE"]
+    assert wordstore.load_words(str(path), 7) == ["STRASSE"]
+    assert WordStore(wordstore.load_words(str(path), 6), 6).size == 2
@@ -0,0 +1,238 @@
+from collections import Counter, namedtuple
+
+import feedback
+import wordstore
+from candidates import CandidateTracker, HardModeRules, constraint_mask
+
+# game engine, no Tk/PIL/pygame so it can run headless
+
+
+class Wordle:
+    MAX_ATTEMPTS = 6
+    WORD_LENGTH = 5
+    VOIDED_LETTER = "*"
+
+    def __init__(self, secret, store=None, hard_mode=False):
+        self.secret = secret.upper()
+        # the secret picks the word-length shard, e.g. a 6 letter game
+        self.store = store or wordstore.get_store(len(self.secret))
+        self.WORD_LENGTH = self.store.length
+        self.attempts = []
+        self.patterns = []
+        self.candidates = CandidateTracker(self.store)
+        # hard mode: later guesses must keep the revealed greens and yellows
+        self.rules = HardModeRules(self.WORD_LENGTH) if hard_mode else None
+
+    def is_valid(self, word):
+        return word.upper() in self.store
+
+    def violation(self, word):
+        # why a (possibly partial) guess breaks hard mode, None if it doesn't
+        if self.rules is None:
+            return None
+        word = word.upper()
+        if len(word) < self.WORD_LENGTH:
+            return self.rules.check_prefix(word)
+        return self.rules.check(word)
+
+    def legal_words(self):
+        if self.rules is None:
+            return self.store.words
+        return self.rules.legal_words(self.store)
+
+    def attempt(self, word):
+        word = word.upper()
+        code = self.pattern(word)
+        self.apply(word, code)
+        return code
+
+    def apply(self, word, code, constraint=None):
+        # record an already scored guess
+        self.attempts.append(word)
+        self.patterns.append(code)
+        self.candidates.apply(word, code, constraint)
+        if self.rules is not None:
+            self.rules.update(word, code)
+
+    def pattern(self, word):
+        return feedback.pattern(word.upper(), self.secret)
+
+    def guess(self, word):
+        word = word.upper()
+        states = feedback.decode(self.pattern(word), len(word))
+        return [
+            LetterState(ch, state == feedback.YELLOW, state == feedback.GREEN)
+            for ch, state in zip(word, states)
+        ]
+
+    def score_guesses(self, words):
+        # many guesses against this secret, packed pattern codes
+        return feedback.score_secret([w.upper() for w in words], self.secret)
+
+    @staticmethod
+    def score_secrets(word, secrets=None):
+        # one guess against many secrets, packed pattern codes
+        if secrets is not None:
+            secrets = [s.upper() for s in secrets]
+        return feedback.score_guess(word.upper(), secrets)
+
+    @property
+    def is_solved(self):
+        return len(self.attempts) > 0 and self.attempts[-1] == self.secret
+
+    @property
+    def remaining_attempts(self):
+        return self.MAX_ATTEMPTS - len(self.attempts)
+
+    @property
+    def can_attempt(self):
+        return self.remaining_attempts > 0 and not self.is_solved
+
+
+class AbsurdleWordle(Wordle):
+    # adversarial game: no secret is picked up front. Every guess gets the
+    # feedback that keeps the most candidates alive, so the secret is only
+    # pinned down once a single word is left and it gets guessed.
+    MAX_ATTEMPTS = 8
+
+    def __init__(self, store=None, length=None, hard_mode=False):
+        self.store = store or wordstore.get_store(length or wordstore.WORD_LENGTH)
+        self.WORD_LENGTH = self.store.length
+        self.table = feedback.get_table(self.store.length)
+        self.solved = feedback.solved_code(self.store.length)
+        self.attempts = []
+        self.patterns = []
+        self.candidates = CandidateTracker(self.store)
+        self.rules = HardModeRules(self.WORD_LENGTH) if hard_mode else None
+
+    @property
+    def secret(self):
+        # the answer once solved, otherwise one word that still fits
+        if self.is_solved:
+            return self.attempts[-1]
+        return self.candidates.words[0] if self.candidates.count else ""
+
+    def buckets(self, word):
+        # pattern code -> how many candidates would get it
+        word = word.upper()
+        word_id = self.store.id_of(word)
+        if word_id is None:
+            return Counter(feedback.score(word, s) for s in self.candidates.words)
+        ids = None if self.candidates.count == self.store.size else self.candidates.ids
+        return feedback.partition(self.table.row(word_id), ids)
+
+    def pattern(self, word):
+        # the feedback the adversary gives: the largest bucket, ties going
+        # to the fewest greens, then the fewest yellows
+        rank = _tie_rank(self.WORD_LENGTH)
+        counts = self.buckets(word)
+        return min(counts, key=lambda code: (-counts[code], rank[code]))
+
+    @property
+    def is_solved(self):
+        return len(self.patterns) > 0 and self.patterns[-1] == self.solved
+
+
+_tie_ranks = {}
+
+
+def _tie_rank(length):
+    # per code (greens, yellows, code), the adversary's tie break
+    rank = _tie_ranks.get(length)
+    if rank is None:
+        rank = []
+        for code in range(3 ** length):
+            states = feedback.decode(code, length)
+            rank.append((states.count(feedback.GREEN), states.count(feedback.YELLOW), code))
+        _tie_ranks[length] = rank
+    return rank
+
+
+class MultiWordle:
+    # one guess played on several boards at once (Quordle, Octordle, ...)
+    EXTRA_ATTEMPTS = 5
+
+    def __init__(self, secrets, store=None, max_attempts=None):
+        self.store = store or wordstore.get_store(len(secrets[0]))
+        self.WORD_LENGTH = self.store.length
+        self.MAX_ATTEMPTS = max_attempts or len(secrets) + self.EXTRA_ATTEMPTS
+        self.table = feedback.get_table(self.store.length)
+        self.boards = []
+        for secret in secrets:
+            board = Wordle(secret, self.store)
+            board.MAX_ATTEMPTS = self.MAX_ATTEMPTS
+            self.boards.append(board)
+        self.secrets = [board.secret for board in self.boards]
+        self.secret_ids = [self.store.id_of(s) for s in self.secrets]
+        self.attempts = []
+
+    @property
+    def secret(self):
+        return ", ".join(self.secrets)
+
+    @property
+    def active(self):
+        # indexes of the boards still being played
+        return [i for i, board in enumerate(self.boards) if not board.is_solved]
+
+    def is_valid(self, word):
+        return word.upper() in self.store
+
+    def violation(self, word):
+        # no hard mode across boards
+        return None
+
+    def score(self, word, boards):
+        # pattern codes of word on the given boards, from one table row
+        word_id = self.store.id_of(word)
+        ids = [self.secret_ids[i] for i in boards]
+        if word_id is None or None in ids:
+            return [feedback.score(word, self.secrets[i]) for i in boards]
+        return self.table.score_ids(word_id, ids)
+
+    def attempt(self, word):
+        # returns one code per board, None for boards solved earlier
+        word = word.upper()
+        active = self.active
+        codes = [None] * len(self.boards)
+        constraints = {}
+        for i, code in zip(active, self.score(word, active)):
+            # boards that got the same feedback narrow by the same mask
+            constraint = constraints.get(code)
+            if constraint is None:
+                constraint = constraint_mask(self.store, word, code)
+                constraints[code] = constraint
+            self.boards[i].apply(word, code, constraint)
+            codes[i] = code
+        self.attempts.append(word)
+        return codes
+
+    @property
+    def solved_count(self):
+        return sum(board.is_solved for board in self.boards)
+
+    @property
+    def is_solved(self):
+        return all(board.is_solved for board in self.boards)
+
+    @property
+    def remaining_attempts(self):
+        return self.MAX_ATTEMPTS - len(self.attempts)
+
+    @property
+    def can_attempt(self):
+        return self.remaining_attempts > 0 and not self.is_solved
+
+
+def submit_error(wordle, guess):
+    # what the warning popup says when Enter is refused, None to play it
+    if not wordle.is_valid(guess):
+        return f'The word "{guess}"\n' "is not on the list\n"
+    rule = wordle.violation(guess)
+    if rule:
+        return f"Hard mode:\n{rule}\n"
+    return None
+
+
+class LetterState(namedtuple("LetterState", "character is_in_word is_in_position", defaults=(False, False))):
+    __slots__ = ()
@@ -1,66 +1,22 @@
 import tkinter as tk
 from tkinter import messagebox
 import random
-from PIL import Image, ImageTk
+from assets import get_image
 from sound import *
-import json
 import os
-
-class Wordle:
-    MAX_ATTEMPTS = 6
-    WORD_LENGTH = 5
-    VOIDED_LETTER = "*"
-
-    def __init__(self, secret):
-        self.secret = secret.upper()
-        self.attempts = []
-
-    def attempt(self, word):
-        self.attempts.append(word.upper())
-
-    def guess(self, word):
-        word = word.upper()
-        result = [LetterState(x) for x in word]
-        remaining_secret = list(self.secret)
-
-        for i in range(self.WORD_LENGTH):
-            if result[i].character == remaining_secret[i]:
-                result[i].is_in_position = True
-                remaining_secret[i] = self.VOIDED_LETTER
-
-        for i in range(self.WORD_LENGTH):
-            if result[i].is_in_position:
-                continue
-            for j in range(self.WORD_LENGTH):
-                if result[i].character == remaining_secret[j]:
-                    result[i].is_in_word = True
-                    remaining_secret[j] = self.VOIDED_LETTER
-                    break
-
-        return result
-
-    @property
-    def is_solved(self):
-        return len(self.attempts) > 0 and self.attempts[-1] == self.secret
-
-    @property
-    def remaining_attempts(self):
-        return self.MAX_ATTEMPTS - len(self.attempts)
-
-    @property
-    def can_attempt(self):
-        return self.remaining_attempts > 0 and not self.is_solved
-
-
-class LetterState:
-    def __init__(self, character):
-        self.character = character
-        self.is_in_word = False
-        self.is_in_position = False
-
-
-
-
+import threading
+import time
+from collections import deque
+import feedback
+import solver
+import wordstore
+from wordle_engine import AbsurdleWordle, MultiWordle, Wordle, submit_error
+from screens import ScreenManager
+from board import RENDERERS
+from animation import Animator, BubblePool
+from stats import get_stats_store
+import profiler
+from profiler import traced
 
 
 class WordleApp:
@@ -75,45 +31,40 @@ class WordleApp:
         "key_default": "#818384"
     }
 
-    STATS_FILE = "wordle_stats.json"
-
-    def load_stats(self):
-        if os.path.exists(self.STATS_FILE):
-            try:
-                with open(self.STATS_FILE, "r") as f:
-                    return json.load(f)
-            except:
-                return {"wins": 0, "losses": 0}
-        else:
-            return {"wins": 0, "losses": 0}
+    STATE_COLORS = {
+        feedback.GREEN: "green",
+        feedback.YELLOW: "yellow",
+        feedback.GRAY: "dark-grey",
+    }
 
-    def save_stats(self):
-        with open(self.STATS_FILE, "w") as f:
-            json.dump(self.stats, f)
+    # "widgets" (Label/Button grid) or "canvas" (single canvas renderer)
+    RENDERER = os.environ.get("WORDLE_RENDERER", "widgets")
+    # 4..8, loaded the first time a game of that length is played
+    WORD_LENGTH = int(os.environ.get("WORDLE_WORD_LENGTH", wordstore.WORD_LENGTH))
+    # revealed greens and yellows must be used in later guesses
+    HARD_MODE = os.environ.get("WORDLE_HARD_MODE", "0") not in ("", "0")
 
     def get_stats_message(self):
-        wins = self.stats["wins"]
-        losses = self.stats["losses"]
-        total = wins + losses
-        
-        if total > 0:
-            percentage = (wins / total) * 100
-        else:
-            percentage = 0
-            
-        return f"\nWins: {wins} | Losses: {losses}\nWin Rate: {percentage:.1f}%"
+        stats = self.stats.aggregate
+        return f"\nWins: {stats.wins} | Losses: {stats.losses}\nWin Rate: {stats.win_rate:.1f}%"
     
 
-    def __init__(self, root):
+    @traced("game.init")
+    def __init__(self, root, screens=None, renderer=None, length=None, hard_mode=None):
         self.root = root
-        self.stats = self.load_stats()
-        self.root.title("Wordle")
-        self.root.attributes("-fullscreen", True)
-        def exit_fullscreen(event=None):
-            self.root.attributes("-fullscreen", False)
-
-        self.sound = SoundManager()
-        self.sound.play_game_music()
+        self.length = length or self.WORD_LENGTH
+        self.hard_mode = self.HARD_MODE if hard_mode is None else hard_mode
+        standalone = screens is None
+        if standalone:
+            screens = ScreenManager(root)
+            screens.register("menu", _main_menu)
+            screens.adopt("game", self)
+        self.screens = screens
+        # shared per process, the UI only reads its in-memory aggregate
+        self.stats = get_stats_store()
+
+        self.sound = get_sound()
+        preload_sound_manager()
 
         
 
@@ -123,13 +74,10 @@ class WordleApp:
         self.root.iconphoto(True, icon_image)
 
         self.bg_canvas = tk.Canvas(self.root, width=1920, height=1080, highlightthickness=0)
-        self.bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
         screen_w = self.root.winfo_screenwidth()
         screen_h = self.root.winfo_screenheight()
 
-        bg = Image.open("images/bg_game.png")
-        bg = bg.resize((screen_w, screen_h), Image.LANCZOS)
-        self.bg_img = ImageTk.PhotoImage(bg)
+        self.bg_img = get_image("images/bg_game.png", (screen_w, screen_h))
 
         self.bg_canvas.create_image(0, 0, anchor="nw", image=self.bg_img)
 
@@ -145,157 +93,264 @@ class WordleApp:
         )
         
         self.update_stats_label()
+
+        self.remaining_text_id = self.bg_canvas.create_text(
+            50, 400,
+            anchor="nw",
+            text="",
+            font=("Clarendon BT", 16, "bold"),
+            fill="white",
+            justify="left"
+        )
+        self.hint_text_id = self.bg_canvas.create_text(
+            50, 440,
+            anchor="nw",
+            text="",
+            font=("Clarendon BT", 16, "bold"),
+            fill="#c9b458",
+            justify="left"
+        )
+        # hard mode: why the guess being typed is not allowed
+        self.rule_text_id = self.bg_canvas.create_text(
+            50, 480,
+            anchor="nw",
+            text="",
+            font=("Clarendon BT", 16, "bold"),
+            fill="#ff6b6b",
+            justify="left"
+        )
         
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
         
-        # load words
-        try:
-            with open("wordlist_upd.txt", "r") as f:
-                self.words = [w.strip().upper() for w in f if len(w.strip()) == 5]
-        except Exception:
-            self.words = ["APPLE", "MANGO", "BERRY", "GRAPE", "LEMON"]
-
-        self.secret = random.choice(self.words)
-        self.wordle = Wordle(self.secret)
+        # words are loaded once per process and shared
+        self.store = wordstore.get_store(self.length)
+
+        self.wordle = self.new_wordle()
         self.current_guess = ""
+        self.shown_guess = ""
+        self.rule_text = ""
+        self.round_started = time.monotonic()
         self.revealing = False
+        self.hint_pending = False
 
-        self.tiles = []
-        self.key_buttons = {}      
-        # for bubble messages
-        self.bubble_widgets = []
+        # keystrokes are queued and applied in one batch per idle pass,
+        # including the ones typed while a row is still revealing
+        self.input_queue = deque()
+        self.input_flush_id = None
+        self.input_latency = deque(maxlen=256)
 
+        # opening hints come from the on-disk cache, fill it in the background
+        self.solver = solver.get_solver(length=self.length)
+        if self.solver.table.dense:
+            threading.Thread(target=self.solver.warm, daemon=True).start()
 
-        self.btn_back_img = tk.PhotoImage(file="images/back.png")
+        self.key_states = {}
+        # tile flips, key recolours and bubbles all run on one clock
+        self.animator = Animator(self.root)
+        self.bubbles = BubblePool(self.root, self.animator)
+
+
+        self.btn_back_img = get_image("images/back.png")
         self.back_btn = self.bg_canvas.create_image(100, 50, image=self.btn_back_img)
         self.bg_canvas.tag_bind(self.back_btn, "<Button-1>", self.back_menu)
-        self.root.bind("<Escape>", self.back_menu)
 
-        self.create_grid()
-        self.create_keyboard()
+        self.btn_hint_img = get_image("images/btn_hint.png")
+        self.hint_btn = self.bg_canvas.create_image(100, 130, image=self.btn_hint_img)
+        self.bg_canvas.tag_bind(self.hint_btn, "<Button-1>", self.show_hint)
+        self.update_remaining_label()
+
+        self.board = RENDERERS[renderer or self.RENDERER](self)
+        # the screen manager shows screens it builds itself
+        if standalone:
+            self.show()
+
+    def new_wordle(self):
+        self.secret = random.choice(self.store.words)
+        return Wordle(self.secret, self.store, self.hard_mode)
+
+    @traced("game.show")
+    def show(self):
+        # the screen is reused between rounds, start a fresh one if needed
+        if self.wordle.attempts or self.current_guess:
+            self.reset_game()
+        self.root.title("Wordle")
+        self.root.attributes("-fullscreen", True)
+        self.root.bind("<Escape>", self.back_menu)
+        self.bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
+        self.bg_canvas.lift()
+        self.board.show()
         self.create_input_events()
-        self.grid_frame.lift()
-        self.keyboard_frame.lift()
+        self.update_stats_label()
+        self.sound.play_game_music()
+
+    def hide(self):
+        self.cancel_reveal()
+        self.bubbles.clear()
+        self.input_queue.clear()
+        self.root.unbind("<Key>")
+        self.board.hide()
+        self.bg_canvas.place_forget()
 
 
     def update_stats_label(self):
-        wins = self.stats.get("wins", 0)
-        losses = self.stats.get("losses", 0)
-        total = wins + losses
-        percentage = (wins / total * 100) if total > 0 else 0
+        stats = self.stats.aggregate
+        distribution = "  ".join(
+            f"{n}:{count}" for n, count in enumerate(stats.distribution) if n > 0
+        )
         
-        display_text = f"Wins: {wins} | Losses: {losses}\nWin Rate: {percentage:.1f}%"
+        display_text = (
+            f"Wins: {stats.wins} | Losses: {stats.losses}\n"
+            f"Win Rate: {stats.win_rate:.1f}%\n"
+            f"Streak: {stats.current_streak} (best {stats.max_streak})\n"
+            f"{distribution}"
+        )
         
         self.bg_canvas.itemconfigure(self.stats_text_id, text=display_text)
 
-    # grid
-    def create_grid(self):
-        self.grid_frame = tk.Frame(self.root, bg=self.COLORS["bg"])
-        self.grid_frame.pack(pady=35)
-        for r in range(self.wordle.MAX_ATTEMPTS):
-            row = []
-            for c in range(self.wordle.WORD_LENGTH):
-                lbl = tk.Label(
-                    self.grid_frame,
-                    text="",
-                    font=("Clarendon BT", 28, "bold"),
-                    width=2,
-                    height=1,
-                    bg=self.COLORS["bg"],
-                    fg=self.COLORS["tile_text"],
-                    relief="groove",
-                    borderwidth=6
-                )
-                lbl.grid(row=r, column=c, padx=5, pady=5)
-                row.append(lbl)
-            self.tiles.append(row)
-
-    # keyboard
-    def create_keyboard(self):
-        self.keyboard_frame = tk.Frame(self.root, bg=self.COLORS["bg"])
-        self.keyboard_frame.pack(pady=10)
-
-        keyboard_rows = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
-        for r, keys in enumerate(keyboard_rows):
-            row_frame = tk.Frame(self.keyboard_frame, bg=self.COLORS["bg"])
-            row_frame.pack(pady=3)
-            for k in keys:
-                btn = tk.Button(
-                    row_frame,
-                    text=k,
-                    width=4,
-                    height=2,
-                    font=("Clarendon BT", 12, "bold"),
-                    bg=self.COLORS["key_default"],
-                    fg="white",
-                    activebackground="#565758",
-                    command=lambda ch=k: self.key_press(ch)
-                )
-                btn.pack(side=tk.LEFT, padx=4)
-                self.key_buttons[k] = btn  # save reference
-            if r == 2:
-                tk.Button(
-                    row_frame, text="←", width=6, height=2,
-                    font=("Clarendon BT", 12, "bold"),
-                    bg=self.COLORS["key_default"], fg="white",
-                    command=self.backspace
-                ).pack(side=tk.LEFT, padx=3)
-                tk.Button(
-                    row_frame, text="ENTER", width=8, height=2,
-                    font=("Clarendon BT", 12, "bold"),
-                    bg="#538d4e", fg="white",
-                    command=self.submit
-                ).pack(side=tk.LEFT, padx=3)
+    def update_remaining_label(self):
+        count = len(self.wordle.candidates)
+        word = "word" if count == 1 else "words"
+        self.bg_canvas.itemconfigure(self.remaining_text_id, text=f"{count} {word} remain")
+
+    # hint
+    def show_hint(self, event=None):
+        if self.revealing or self.hint_pending or not self.wordle.can_attempt:
+            return
+        # solve off the Tk thread, the mainloop polls for the answer
+        wordle = self.wordle
+        turn = len(wordle.attempts)
+        target = self.hint_target()
+        result = []
+        worker = threading.Thread(
+            target=lambda: result.append(self.solver.best_guess(target)), daemon=True
+        )
+        self.hint_pending = True
+        worker.start()
+        self._poll_hint(worker, wordle, turn, result)
+
+    def hint_target(self):
+        return self.wordle
+
+    def _poll_hint(self, worker, wordle, turn, result):
+        if worker.is_alive():
+            self.root.after(15, lambda: self._poll_hint(worker, wordle, turn, result))
+            return
+        self.hint_pending = False
+        # drop hints for a finished game or a turn already played
+        if wordle is not self.wordle or len(wordle.attempts) != turn:
+            return
+        if not result or result[0] is None:
+            return
+        self.bg_canvas.itemconfigure(self.hint_text_id, text=f"Hint: try {result[0]}")
 
     # events
     def create_input_events(self):
         self.root.bind("<Key>", self.on_key)
 
     def on_key(self, event):
-        if self.revealing:
-            return
         if event.keysym == "Return":
-            self.submit()
+            self.queue_input("submit")
         elif event.keysym == "BackSpace":
-            self.backspace()
+            self.queue_input("backspace")
         elif event.char.isalpha() and len(event.char) == 1:
-            self.key_press(event.char.upper())
+            self.queue_input("key", event.char.upper())
+
+    def queue_input(self, kind, value=None):
+        self.input_queue.append((kind, value, time.perf_counter()))
+        if self.input_flush_id is None:
+            self.input_flush_id = self.root.after_idle(self.flush_input)
+
+    @traced("input.flush")
+    def flush_input(self):
+        self.input_flush_id = None
+        stamps = []
+        # whatever is left while a row reveals waits for _finish_reveal
+        while self.input_queue and not self.revealing:
+            kind, value, stamp = self.input_queue.popleft()
+            stamps.append(stamp)
+            if kind == "key":
+                self.key_press(value)
+            elif kind == "backspace":
+                self.backspace()
+            elif kind == "submit":
+                self.render_guess()
+                self.submit()
+        self.render_guess()
+        self.update_rule_label()
+        if stamps:
+            self.root.update_idletasks()
+            now = time.perf_counter()
+            self.input_latency.extend((now - stamp) * 1000 for stamp in stamps)
+            for stamp in stamps:
+                profiler.record_since("input_to_paint", stamp, "input")
+
+    def input_latency_stats(self):
+        # key-to-paint latency in ms over the most recent keystrokes
+        samples = sorted(self.input_latency)
+        if not samples:
+            return {"count": 0}
+        return {
+            "count": len(samples),
+            "p50": samples[len(samples) // 2],
+            "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+            "max": samples[-1],
+        }
 
     def key_press(self, t):
         if len(self.current_guess) < self.wordle.WORD_LENGTH and self.wordle.can_attempt and not self.revealing:
-            row = len(self.wordle.attempts)
-            lbl = self.tiles[row][len(self.current_guess)]
-            lbl.config(text=t)
             self.current_guess += t
 
     def backspace(self):
         if len(self.current_guess) > 0 and not self.revealing:
-            row = len(self.wordle.attempts)
-            col = len(self.current_guess) - 1
-            self.tiles[row][col].config(text="")
             self.current_guess = self.current_guess[:-1]
 
+    def render_guess(self):
+        # draw only the tiles of the current row that changed since last time
+        row = len(self.wordle.attempts)
+        if row >= self.wordle.MAX_ATTEMPTS:
+            return
+        shown, guess = self.shown_guess, self.current_guess
+        for i in range(max(len(shown), len(guess))):
+            ch = guess[i] if i < len(guess) else ""
+            if i >= len(shown) or shown[i] != ch:
+                self.board.set_letter(row, i, ch)
+        self.shown_guess = guess
+
+    def update_rule_label(self):
+        # flag a hard mode violation while the guess is typed
+        message = self.wordle.violation(self.current_guess) if self.current_guess else None
+        text = message or ""
+        if text != self.rule_text:
+            self.rule_text = text
+            self.bg_canvas.itemconfigure(self.rule_text_id, text=text)
+
     # sumbit
+    @traced("submit")
     def submit(self):
         if self.revealing:
             return
         if len(self.current_guess) != self.wordle.WORD_LENGTH:
             return
-        if self.current_guess not in self.words:
-            self.warning()
+        error = submit_error(self.wordle, self.current_guess)
+        if error:
+            self.warning(error)
             return
 
-        self.wordle.attempt(self.current_guess)
-        result = self.wordle.guess(self.current_guess)
-        self.reveal_index = 0
-        self.reveal_result = result
-        self.revealing = True
-        self._reveal_step()
+        code = self.wordle.attempt(self.current_guess)
+        self.bg_canvas.itemconfigure(self.hint_text_id, text="")
+        self.reveal_word = self.current_guess
+        self.reveal_result = self.reveal_states(code)
         self.current_guess = ""
+        self.shown_guess = ""
+        self.start_reveal(len(self.wordle.attempts) - 1)
+
 
+    def reveal_states(self, code):
+        return feedback.decode(code, self.length)
 
-    def warning(self):
+    @traced("popup.warning")
+    def warning(self, message):
         popup = tk.Toplevel(self.root)
         popup.title("Invalid")
 
@@ -317,9 +372,7 @@ class WordleApp:
         popup.grab_set()
         popup.focus_force()
 
-        bg = Image.open("images/bg_ins.png")
-        bg = bg.resize((popup_width, popup_height), Image.LANCZOS)
-        popup.bg_image = ImageTk.PhotoImage(bg)
+        popup.bg_image = get_image("images/bg_ins.png", (popup_width, popup_height))
 
         
         popup.canvas = tk.Canvas(popup, width=popup_width, height=popup_height, highlightthickness=0)
@@ -330,7 +383,7 @@ class WordleApp:
         
         popup.canvas.create_text(
             popup_width//2, popup_height//2,
-            text=f'The word "{self.current_guess}"\n' "is not on the list\n",
+            text=message,
             font=("Clarendon BT", 22, "bold"),
             fill="white",
             justify="center"
@@ -342,122 +395,91 @@ class WordleApp:
         popup.bind("<Return>", lambda e: popup.destroy())
 
     # show bubble message
-    def show_bubble_message(self, tile, message, color):
+    def show_bubble_message(self, row, col, message, color):
         # get tile position
-        tile_x = tile.winfo_rootx() - self.root.winfo_rootx()
-        tile_y = tile.winfo_rooty() - self.root.winfo_rooty()
-        tile_width = tile.winfo_width()
-        
-        # create bubble frame
-        bubble_frame = tk.Frame(self.root, bg=color, relief="solid", borderwidth=2)
-        bubble_frame.place(x=tile_x + tile_width//2 - 60, y=tile_y - 30)
-        
-        # create label with message
-        bubble_label = tk.Label(
-            bubble_frame,
-            text=message,
-            font=("Clarendon BT", 10, "bold"),
-            bg=color,
-            fg="white",
-            padx=2,
-            pady=1
-        )
-        bubble_label.pack()
-        
-        # store reference
-        self.bubble_widgets.append(bubble_frame)
-        
-        
-        self.root.after(2000, lambda: self.remove_bubble(bubble_frame))
-    
-    def remove_bubble(self, bubble_frame):
-        try:
-            bubble_frame.destroy()
-            if bubble_frame in self.bubble_widgets:
-                self.bubble_widgets.remove(bubble_frame)
-        except:
-            pass
+        tile_x, tile_y, tile_width = self.board.tile_position(row, col)
+        self.bubbles.show(tile_x + tile_width//2 - 60, tile_y - 30, message, color)
 
     # reveal
-    def _reveal_step(self):
-        
-        row = len(self.wordle.attempts) - 1
-        i = self.reveal_index
-        if i >= len(self.reveal_result):
-            self.revealing = False
-            if self.wordle.is_solved:
-                self.stats["wins"] += 1
-                self.save_stats()
-                stats_msg = self.get_stats_message()
-                self.won("You guessed it!\n" "Congratulations!!")
-                
-            elif not self.wordle.can_attempt:
-                self.stats["losses"] += 1
-                self.save_stats()
-                stats_msg = self.get_stats_message()
-                self.lost("Out of attempts\n" f'The word was "{self.wordle.secret}"\n')
-            return
+    REVEAL_FLIP_MS = 180
+    REVEAL_STEP_MS = 380
 
-        letter_state = self.reveal_result[i]
-        tile = self.tiles[row][i]
-        tile_char = letter_state.character
-        tile.config(text=tile_char)
-
-        # determine color and message
-        if letter_state.is_in_position:
-            color = self.COLORS["green"]
-            message = "Correct spot!"
-        elif letter_state.is_in_word:
-            color = self.COLORS["yellow"]
-            message = "Wrong spot"
-        else:
-            color = self.COLORS["dark-grey"]
-            message = None
-
-        # color the tile and keyboard key
-        def apply_color():
-            tile.config(bg=color, fg="white")
-            self.update_key_color(tile_char, color)
-            
-            # Show bubble message for green and yellow
-            if message:
-                self.show_bubble_message(tile, message, color)
-            
-            self.reveal_index += 1
-            self.root.after(200, self._reveal_step)
-
-        self.root.after(180, apply_color)
+    def start_reveal(self, row):
+        # queue every flip of the row up front, one tile every REVEAL_STEP_MS
+        self.revealing = True
+        for i, state in enumerate(self.reveal_result):
+            self.animator.schedule(
+                i * self.REVEAL_STEP_MS + self.REVEAL_FLIP_MS,
+                lambda i=i, state=state: self._reveal_tile(row, i, state),
+                group="reveal"
+            )
+        self.animator.schedule(
+            len(self.reveal_result) * self.REVEAL_STEP_MS, self._finish_reveal, group="reveal"
+        )
 
-    # keyboard color
-    def update_key_color(self, letter, color):
-        btn = self.key_buttons.get(letter.upper())
-        if not btn:
-            return
+    @traced("reveal.tile")
+    def _reveal_tile(self, row, i, state):
+        tile_char = self.reveal_word[i]
+        color = self.COLORS[self.STATE_COLORS[state]]
+        self.board.set_letter(row, i, tile_char)
+        self.board.set_tile_state(row, i, state)
+        self.update_key_color(tile_char, state)
+
+        # Show bubble message for green and yellow
+        if state == feedback.GREEN:
+            self.show_bubble_message(row, i, "Correct spot!", color)
+        elif state == feedback.YELLOW:
+            self.show_bubble_message(row, i, "Wrong spot", color)
+
+    @traced("reveal.finish")
+    def _finish_reveal(self):
+        self.revealing = False
+        self.update_remaining_label()
+        if self.input_queue and self.input_flush_id is None:
+            self.input_flush_id = self.root.after_idle(self.flush_input)
+        if self.wordle.is_solved:
+            self.record_game()
+            self.won("You guessed it!\n" "Congratulations!!")
+
+        elif not self.wordle.can_attempt:
+            self.record_game()
+            self.lost("Out of attempts\n" + self.answer_text())
+
+    def answer_text(self):
+        return f'The word was "{self.wordle.secret}"\n'
+
+    def record_game(self):
+        # queued for the background writer, the label reads the aggregate
+        self.stats.record_game(
+            self.wordle.secret,
+            self.wordle.attempts,
+            self.wordle.is_solved,
+            time.monotonic() - self.round_started
+        )
+        self.update_stats_label()
 
-        
-        current_color = btn.cget("bg")
-        priority = {"green": 3, "yellow": 2, "dark-grey": 1, self.COLORS["key_default"]: 0}
-        current_rank = priority.get(current_color, 0)
-        new_rank = 3 if color == self.COLORS["green"] else 2 if color == self.COLORS["yellow"] else 1
+    def cancel_reveal(self):
+        self.animator.cancel("reveal")
+        self.revealing = False
+
+    # keyboard color
+    def update_key_color(self, letter, state):
+        letter = letter.upper()
 
-        if new_rank > current_rank:
-            btn.config(bg=color)
+        # states rank gray < yellow < green, a key only ever moves up
+        current = self.key_states.get(letter)
+        if current is None or state > current:
+            self.key_states[letter] = state
+            self.board.set_key_state(letter, state)
 
     def back_menu(self, event=None):
-        try:
-            self.grid_frame.pack_forget()
-            self.keyboard_frame.pack_forget()
-        except:
-            pass
-        from main import MainMenu
-        self.sound.stop_music()
-        self.sound.play_menu_music()
-        MainMenu(self.root)
+        self.screens.show("menu")
 
 
 
 
     # end game
+    @traced("popup.won")
     def won(self, msg):
         popup = tk.Toplevel(self.root)
         popup.resizable(False, False)
@@ -475,9 +497,7 @@ class WordleApp:
         popup.grab_set()
         popup.focus_force()
 
-        bg = Image.open("images/bg_ins.png")
-        bg = bg.resize((popup_width, popup_height), Image.LANCZOS)
-        popup.bg_image = ImageTk.PhotoImage(bg)
+        popup.bg_image = get_image("images/bg_ins.png", (popup_width, popup_height))
 
         
         popup.canvas = tk.Canvas(popup, width=popup_width, height=popup_height, highlightthickness=0)
@@ -497,7 +517,7 @@ class WordleApp:
             popup.destroy()
             self.back_menu()
 
-        popup.btn_back_img = tk.PhotoImage(file="images/btn_main_menu.png")
+        popup.btn_back_img = get_image("images/btn_main_menu.png")
         popup.back_btn = popup.canvas.create_image(popup_width//2, 230, image=popup.btn_back_img)
         popup.canvas.tag_bind(popup.back_btn, "<Button-1>", close_popup)
 
@@ -508,6 +528,7 @@ class WordleApp:
         self.sound.play("win")
 
 
+    @traced("popup.lost")
     def lost(self, msg):
         popup = tk.Toplevel(self.root)
         popup.resizable(False, False)
@@ -525,9 +546,7 @@ class WordleApp:
         popup.grab_set()
         popup.focus_force()
 
-        bg = Image.open("images/bg_ins.png")
-        bg = bg.resize((popup_width, popup_height), Image.LANCZOS)
-        popup.bg_image = ImageTk.PhotoImage(bg)
+        popup.bg_image = get_image("images/bg_ins.png", (popup_width, popup_height))
 
         
         popup.canvas = tk.Canvas(popup, width=popup_width, height=popup_height, highlightthickness=0)
@@ -547,7 +566,7 @@ class WordleApp:
             popup.destroy()
             self.back_menu()
 
-        popup.btn_back_img = tk.PhotoImage(file="images/btn_main_menu.png")
+        popup.btn_back_img = get_image("images/btn_main_menu.png")
         popup.back_btn = popup.canvas.create_image(popup_width//2, 230, image=popup.btn_back_img)
         popup.canvas.tag_bind(popup.back_btn, "<Button-1>", close_popup)
 
@@ -557,22 +576,112 @@ class WordleApp:
     
 
 
+    @traced("game.reset")
     def reset_game(self):
-        self.revealing = False
-        self.secret = random.choice(self.words)
-        self.wordle = Wordle(self.secret)
+        self.cancel_reveal()
+        self.wordle = self.new_wordle()
         self.current_guess = ""
-        self.reveal_index = 0
-        self.reveal_result = []
-        for row in self.tiles:
-            for tile in row:
-                tile.config(text="", bg=self.COLORS["bg"], fg=self.COLORS["tile_text"])
-        for btn in self.key_buttons.values():
-            btn.config(bg=self.COLORS["key_default"])
-    
-    
+        self.shown_guess = ""
+        self.round_started = time.monotonic()
+        self.input_queue.clear()
+        self.reveal_word = ""
+        self.reveal_result = ()
+        self.key_states = {}
+        self.board.reset()
+        self.bg_canvas.itemconfigure(self.hint_text_id, text="")
+        self.update_rule_label()
+        self.update_remaining_label()
+
+
+class MultiWordleApp(WordleApp):
+    # Quordle-style game: every guess is played on BOARDS boards at once
+    BOARDS = 4
+
+    def __init__(self, root, screens=None, boards=None, length=None):
+        self.boards = boards or self.BOARDS
+        super().__init__(root, screens, renderer="multi", length=length)
+
+    def new_wordle(self):
+        secrets = random.sample(self.store.words, self.boards)
+        self.secret = secrets[0]
+        return MultiWordle(secrets, self.store)
+
+    def reveal_states(self, codes):
+        # per position, the state on every board (None once a board is solved)
+        per_board = [
+            feedback.decode(code, self.length) if code is not None else None
+            for code in codes
+        ]
+        return [
+            tuple(states[i] if states is not None else None for states in per_board)
+            for i in range(self.length)
+        ]
+
+    @traced("reveal.tile")
+    def _reveal_tile(self, row, i, states):
+        tile_char = self.reveal_word[i]
+        self.board.set_tile_states(row, i, tile_char, states)
+        played = [state for state in states if state is not None]
+        if played:
+            self.update_key_color(tile_char, max(played))
+
+    def hint_target(self):
+        # hint for the open board with the fewest candidates left
+        boards = [self.wordle.boards[i] for i in self.wordle.active]
+        return min(boards, key=lambda board: board.candidates.count) if boards else self.wordle
+
+    def update_remaining_label(self):
+        wordle = self.wordle
+        active = [wordle.boards[i].candidates.count for i in wordle.active]
+        text = f"{wordle.solved_count}/{len(wordle.boards)} boards solved"
+        if active:
+            text += f"\nfewest left: {min(active)}"
+        self.bg_canvas.itemconfigure(self.remaining_text_id, text=text)
+
+    def answer_text(self):
+        missed = [wordle.secret for wordle in self.wordle.boards if not wordle.is_solved]
+        lines = [", ".join(missed[i:i + 4]) for i in range(0, len(missed), 4)]
+        return "Missed:\n" + "\n".join(lines) + "\n"
+
+    def record_game(self):
+        # the stats track single-board games only
+        pass
+
+
+class AbsurdleApp(WordleApp):
+    # adversarial game: the secret dodges every guess for as long as it can
+
+    def new_wordle(self):
+        self.secret = None
+        return AbsurdleWordle(self.store, hard_mode=self.hard_mode)
+
+    def answer_text(self):
+        return f'It could have been "{self.wordle.secret}"\n'
+
+    def record_game(self):
+        # the stats track normal games only
+        pass
+
+
+def game_screen(root, screens):
+    # WORDLE_BOARDS=4/8/16 plays the multi-board mode,
+    # WORDLE_MODE=absurdle the adversarial one
+    if os.environ.get("WORDLE_MODE", "").lower() == "absurdle":
+        return AbsurdleApp(root, screens)
+    boards = int(os.environ.get("WORDLE_BOARDS", "1"))
+    if boards > 1:
+        return MultiWordleApp(root, screens, boards=boards)
+    return WordleApp(root, screens)
+
+
+def _main_menu(root, screens):
+    from main import MainMenu
+    return MainMenu(root, screens)
+
 
 if __name__ == "__main__":
     root = tk.Tk()
+    profiler.watch_tk(root)
+    profiler.mark_startup(root)
     app = WordleApp(root)
     root.mainloop()
\ No newline at end of file
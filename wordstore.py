@@ -0,0 +1,337 @@
+import argparse
+import hashlib
+import mmap
+import os
+import re
+import string
+import struct
+import sys
+from functools import cached_property
+
+# shared word store
+#
+# The word list is read once per process. Every word gets a stable integer
+# id (its position in the file, duplicates dropped) and sets of words are
+# handled as int bitsets over those ids, bit i standing for word i.
+#
+# `python wordstore.py build` compiles the text list into a word pack:
+# a fixed header (source file size/mtime/sha256 and the word-list hash),
+# the words as fixed-width uppercase records, then every position and
+# letter-count bitset. The pack is memory-mapped at startup and words and
+# masks are decoded on first use. A pack whose source file has changed is
+# ignored, the text file is read instead and the pack is rewritten.
+#
+# Every word length (MIN_LENGTH..MAX_LENGTH) is its own shard with its own
+# list file, pack and store, opened the first time get_store(length) asks
+# for it. Five letters use wordlist_upd.txt, other lengths
+# wordlist_<length>.txt, or else their share of one big mixed-length
+# dictionary.txt.
+
+WORD_LENGTH = 5
+MIN_LENGTH = 4
+MAX_LENGTH = 8
+WORDLIST_FILE = "wordlist_upd.txt"
+DICTIONARY_FILE = "dictionary.txt"
+FALLBACK_WORDS = ["APPLE", "MANGO", "BERRY", "GRAPE", "LEMON"]
+PACK_FILE = os.path.join("cache", "words.pack")
+
+_PACK_MAGIC = b"WDLWP1"
+# magic, word length, word count, source size, source mtime_ns,
+# source sha256, word-list hash
+_PACK_HEADER = struct.Struct("<6sBIQQ32s32s")
+_LETTERS = string.ascii_uppercase
+
+
+def wordlist_path(length=WORD_LENGTH):
+    if length == WORD_LENGTH:
+        return WORDLIST_FILE
+    path = f"wordlist_{length}.txt"
+    if not os.path.exists(path) and os.path.exists(DICTIONARY_FILE):
+        return DICTIONARY_FILE
+    return path
+
+
+def pack_path(length=WORD_LENGTH):
+    if length == WORD_LENGTH:
+        return PACK_FILE
+    return os.path.join("cache", f"words_{length}.pack")
+
+
+def available_lengths():
+    return [
+        n for n in range(MIN_LENGTH, MAX_LENGTH + 1)
+        if n == WORD_LENGTH or os.path.exists(wordlist_path(n)) or os.path.exists(pack_path(n))
+    ]
+
+
+def load_words(path=WORDLIST_FILE, length=WORD_LENGTH):
+    try:
+        # uppercase first (it can change the length), then plain A-Z only,
+        # so the pack, its hash and the in-memory store see the same list
+        plain = re.compile(f"[A-Z]{{{length}}}")
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            words = [w for w in (line.strip().upper() for line in f) if plain.fullmatch(w)]
+    except Exception:
+        words = list(FALLBACK_WORDS) if length == WORD_LENGTH else []
+    # keep file order, drop repeated entries so every word has a single id
+    return list(dict.fromkeys(words))
+
+
+def word_list_hash(words):
+    return hashlib.sha256("\n".join(words).encode("ascii")).digest()
+
+
+def bitset(ids, size):
+    buf = bytearray((size + 7) // 8)
+    for i in ids:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+def iter_ids(mask):
+    bits = bin(mask)[:1:-1]
+    i = bits.find("1")
+    while i != -1:
+        yield i
+        i = bits.find("1", i + 1)
+
+
+class WordStore:
+    def __init__(self, words, length=WORD_LENGTH):
+        self.length = length
+        self.words = tuple(words)
+        self.ids = {w: i for i, w in enumerate(self.words)}
+        self.size = len(self.words)
+        self.word_hash = word_list_hash(self.words)
+        self.all_mask = (1 << self.size) - 1
+
+        positions = [{} for _ in range(length)]
+        counts = {}
+        for i, w in enumerate(self.words):
+            for p, c in enumerate(w):
+                positions[p].setdefault(c, []).append(i)
+            for c in set(w):
+                per_letter = counts.setdefault(c, [[] for _ in range(length + 1)])
+                for m in range(1, w.count(c) + 1):
+                    per_letter[m].append(i)
+
+        # position_masks[p][c]: words with letter c at position p
+        self.position_masks = [
+            {c: bitset(ids, self.size) for c, ids in pos.items()}
+            for pos in positions
+        ]
+        # count_masks[c][m]: words containing letter c at least m times
+        self.count_masks = {
+            c: [self.all_mask] + [bitset(ids, self.size) for ids in per_letter[1:]]
+            for c, per_letter in counts.items()
+        }
+        self.letter_masks = {c: masks[1] for c, masks in self.count_masks.items()}
+
+    def __contains__(self, word):
+        return word in self.ids
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def id_of(self, word):
+        return self.ids.get(word)
+
+    def word(self, word_id):
+        return self.words[word_id]
+
+    def position_mask(self, position, letter):
+        return self.position_masks[position].get(letter, 0)
+
+    def count_mask(self, letter, count):
+        if count <= 0:
+            return self.all_mask
+        masks = self.count_masks.get(letter)
+        if masks is None or count > self.length:
+            return 0
+        return masks[count]
+
+    def words_in(self, mask):
+        words = self.words
+        return [words[i] for i in iter_ids(mask)]
+
+
+class PackedWordStore(WordStore):
+    # WordStore backed by a memory-mapped word pack
+    def __init__(self, mm, header):
+        _, length, size, _, _, _, word_hash = header
+        self._mm = mm
+        self.length = length
+        self.size = size
+        self.word_hash = word_hash
+        self.all_mask = (1 << size) - 1
+        self._mask_bytes = (size + 7) // 8
+        self._words_at = _PACK_HEADER.size
+        self._masks_at = self._words_at + size * length
+        self._masks = {}
+
+    @cached_property
+    def words(self):
+        start = self._words_at
+        text = self._mm[start:start + self.size * self.length].decode("ascii")
+        n = self.length
+        return tuple(text[i:i + n] for i in range(0, len(text), n))
+
+    @cached_property
+    def ids(self):
+        return {w: i for i, w in enumerate(self.words)}
+
+    def _mask(self, index):
+        mask = self._masks.get(index)
+        if mask is None:
+            start = self._masks_at + index * self._mask_bytes
+            mask = int.from_bytes(self._mm[start:start + self._mask_bytes], "little")
+            self._masks[index] = mask
+        return mask
+
+    def position_mask(self, position, letter):
+        column = _LETTERS.find(letter)
+        if column < 0 or len(letter) != 1:
+            return 0
+        return self._mask(position * 26 + column)
+
+    def count_mask(self, letter, count):
+        if count <= 0:
+            return self.all_mask
+        column = _LETTERS.find(letter)
+        if column < 0 or len(letter) != 1 or count > self.length:
+            return 0
+        return self._mask(self.length * 26 + column * self.length + count - 1)
+
+    @cached_property
+    def position_masks(self):
+        return [
+            {c: m for c in _LETTERS if (m := self.position_mask(p, c))}
+            for p in range(self.length)
+        ]
+
+    @cached_property
+    def count_masks(self):
+        masks = {}
+        for c in _LETTERS:
+            if self.count_mask(c, 1):
+                masks[c] = [self.count_mask(c, m) for m in range(self.length + 1)]
+        return masks
+
+    @cached_property
+    def letter_masks(self):
+        return {c: masks[1] for c, masks in self.count_masks.items()}
+
+
+def _source_info(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def _file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").digest()
+
+
+def build_pack(source=WORDLIST_FILE, path=PACK_FILE, length=WORD_LENGTH):
+    words = load_words(source, length)
+    store = WordStore(words, length)
+    size, mtime = _source_info(source)
+    header = _PACK_HEADER.pack(
+        _PACK_MAGIC, length, store.size, size, mtime, _file_hash(source), store.word_hash
+    )
+    mask_bytes = (store.size + 7) // 8
+    masks = [
+        store.position_mask(p, c) for p in range(length) for c in _LETTERS
+    ] + [
+        store.count_mask(c, m) if c in store.count_masks else 0
+        for c in _LETTERS for m in range(1, length + 1)
+    ]
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write("".join(store.words).encode("ascii"))
+        for mask in masks:
+            f.write(mask.to_bytes(mask_bytes, "little"))
+    os.replace(tmp, path)
+    return store
+
+
+def open_pack(path=PACK_FILE, source=WORDLIST_FILE, length=WORD_LENGTH):
+    # the packed store, or None when the pack is missing, broken or stale
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        header = _PACK_HEADER.unpack_from(mm)
+    except struct.error:
+        return None
+    magic, pack_length, size, src_size, src_mtime, src_hash, _ = header
+    mask_bytes = (size + 7) // 8
+    expected = _PACK_HEADER.size + size * pack_length + 52 * pack_length * mask_bytes
+    if magic != _PACK_MAGIC or pack_length != length or len(mm) != expected:
+        return None
+    try:
+        info = _source_info(source)
+    except OSError:
+        info = None  # no text list, the pack is all there is
+    # size + mtime is the quick check, the content hash settles a touched file
+    if info is not None and info != (src_size, src_mtime) and _file_hash(source) != src_hash:
+        return None
+    return PackedWordStore(mm, header)
+
+
+def load_store(source=WORDLIST_FILE, pack=PACK_FILE, length=WORD_LENGTH):
+    store = open_pack(pack, source, length)
+    if store is not None:
+        return store
+    if os.path.exists(source):
+        try:
+            return build_pack(source, pack, length)
+        except (OSError, ValueError):
+            pass
+    return WordStore(load_words(source, length), length)
+
+
+_stores = {}
+
+
+def get_store(length=WORD_LENGTH):
+    store = _stores.get(length)
+    if store is None:
+        if not MIN_LENGTH <= length <= MAX_LENGTH:
+            raise ValueError(f"unsupported word length: {length}")
+        store = load_store(wordlist_path(length), pack_path(length), length)
+        if not store.size:
+            raise ValueError(f"no {length}-letter word list ({wordlist_path(length)})")
+        _stores[length] = store
+    return store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Word list tools.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="compile a word list into its pack under cache/")
+    build.add_argument("--length", type=int, default=None,
+                       help="only this word length, default every available one")
+    build.add_argument("--source", default=None, help="list file, default wordlist_path(length)")
+    build.add_argument("--out", default=None)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        lengths = [args.length] if args.length else available_lengths()
+        for length in lengths:
+            out = args.out or pack_path(length)
+            store = build_pack(args.source or wordlist_path(length), out, length)
+            print(f"{out}: {store.size} words, {os.path.getsize(out)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())